@@ -0,0 +1,76 @@
+import sys
+import json
+import argparse
+
+# (metric path, label, True when a higher value is better)
+METRICS = (
+    (("latency_ms", "p50"), "p50 ms", False),
+    (("latency_ms", "p95"), "p95 ms", False),
+    (("latency_ms", "p99"), "p99 ms", False),
+    (("invocations_per_second",), "inv/s", True),
+    (("auth_calls_per_invocation",), "auth/inv", False),
+    (("api_calls_per_invocation",), "api/inv", False),
+    (("peak_traced_memory_mb",), "peak MB", False),
+    (("errors",), "errors", False),
+)
+GUARDED_METRICS = ("p95 ms", "inv/s", "auth/inv", "errors")
+
+
+def load_runs(path: str) -> dict:
+    with open(path, encoding="utf-8") as results_file:
+        report = json.load(results_file)
+    return {(run["scenario"], run["concurrency"]): run for run in report["runs"]}
+
+
+def metric_value(run: dict, path: tuple) -> float:
+    value = run
+    for key in path:
+        value = value[key]
+    return float(value)
+
+
+def change(baseline: float, candidate: float) -> float:
+    if baseline == 0:
+        return 0.0 if candidate == 0 else float("inf")
+    return (candidate - baseline) / baseline * 100
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Compare two benchmark result files")
+    parser.add_argument("baseline")
+    parser.add_argument("candidate")
+    parser.add_argument("--threshold", type=float, default=10.0,
+                        help="Percent change in p95, throughput, auth calls or errors that counts as a regression")
+    args = parser.parse_args()
+
+    baseline_runs = load_runs(args.baseline)
+    candidate_runs = load_runs(args.candidate)
+    regressions = []
+
+    print(f"{'scenario':>8} {'conc':>4} {'metric':>9} {'baseline':>10} {'candidate':>10} {'change':>9}")
+    for key in sorted(baseline_runs.keys() & candidate_runs.keys()):
+        for path, label, higher_is_better in METRICS:
+            before = metric_value(baseline_runs[key], path)
+            after = metric_value(candidate_runs[key], path)
+            delta = change(before, after)
+            worse = delta < -args.threshold if higher_is_better else delta > args.threshold
+            flag = " !" if worse and label in GUARDED_METRICS else ""
+            if flag:
+                regressions.append(f"{key[0]} c={key[1]} {label}: {before:g} -> {after:g} ({delta:+.1f}%)")
+            print(f"{key[0]:>8} {key[1]:>4} {label:>9} {before:>10g} {after:>10g} {delta:>+8.1f}%{flag}")
+
+    missing = sorted(baseline_runs.keys() ^ candidate_runs.keys())
+    if missing:
+        print(f"Not compared (present in only one file): {missing}")
+
+    if regressions:
+        print(f"\n{len(regressions)} regression(s) beyond {args.threshold:g}%:")
+        for regression in regressions:
+            print(f"  {regression}")
+        return 1
+    print("\nNo regressions beyond the threshold.")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
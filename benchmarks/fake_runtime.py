@@ -0,0 +1,67 @@
+import time
+import threading
+from typing import Optional
+from dify_plugin.entities.tool import ToolInvokeMessage
+
+
+class FakeStorage:
+    # Mirrors plugin storage: bytes values, one round trip per call, and the manifest's 4096-byte quota.
+    def __init__(self, latency_ms: float = 2.0, quota_bytes: int = 4096):
+        self.latency_ms = latency_ms
+        self.quota_bytes = quota_bytes
+        self._lock = threading.Lock()
+        self._data: dict[str, bytes] = {}
+        self.calls = {"get": 0, "set": 0, "delete": 0, "exist": 0}
+
+    def _round_trip(self, operation: str) -> None:
+        with self._lock:
+            self.calls[operation] += 1
+        if self.latency_ms:
+            time.sleep(self.latency_ms / 1000)
+
+    def get(self, key: str) -> Optional[bytes]:
+        self._round_trip("get")
+        with self._lock:
+            return self._data.get(key)
+
+    def set(self, key: str, value: bytes) -> None:
+        self._round_trip("set")
+        with self._lock:
+            used = sum(len(stored) for stored_key, stored in self._data.items() if stored_key != key)
+            if used + len(value) > self.quota_bytes:
+                raise Exception(f"Storage quota exceeded: {used + len(value)} > {self.quota_bytes} bytes")
+            self._data[key] = value
+
+    def delete(self, key: str) -> None:
+        self._round_trip("delete")
+        with self._lock:
+            self._data.pop(key, None)
+
+    def exist(self, key: str) -> bool:
+        self._round_trip("exist")
+        with self._lock:
+            return key in self._data
+
+    def used_bytes(self) -> int:
+        with self._lock:
+            return sum(len(value) for value in self._data.values())
+
+
+class FakeRuntime:
+    def __init__(self, credentials: dict):
+        self.credentials = credentials
+
+
+class FakeSession:
+    def __init__(self, storage: FakeStorage):
+        self.storage = storage
+
+
+def make_tool(tool_class, storage: FakeStorage, username: str = "benchmark@example.com",
+              password: str = "benchmark-password"):
+    # Skips Tool.__init__, which expects a live plugin daemon connection, so set what it would have set.
+    tool = tool_class.__new__(tool_class)
+    tool.runtime = FakeRuntime({"zoominfo_username": username, "zoominfo_password": password})
+    tool.session = FakeSession(storage)
+    tool.response_type = ToolInvokeMessage
+    return tool
@@ -0,0 +1,235 @@
+import json
+import time
+import base64
+import random
+import threading
+from dataclasses import dataclass, asdict
+from datetime import date, timedelta
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+
+@dataclass
+class FakeZoomInfoConfig:
+    latency_ms: float = 50.0
+    jitter_ms: float = 10.0
+    auth_latency_ms: float = 150.0
+    error_rate: float = 0.0
+    unauthorized_rate: float = 0.0
+    rate_limit_rate: float = 0.0
+    retry_after_seconds: float = 0.1
+    payload_items: int = 25
+    text_size: int = 400
+    token_lifetime_seconds: int = 3600
+    seed: int = 7
+
+
+def _b64(data: dict) -> str:
+    return base64.urlsafe_b64encode(json.dumps(data).encode("utf-8")).decode("ascii").rstrip("=")
+
+
+class FakeZoomInfoState:
+    def __init__(self, config: FakeZoomInfoConfig):
+        self.config = config
+        self.random = random.Random(config.seed)
+        self.lock = threading.Lock()
+        self.tokens: set[str] = set()
+        self.counts: dict[str, int] = {}
+        self.statuses: dict[str, int] = {}
+
+    def count(self, key: str, bucket: dict) -> None:
+        with self.lock:
+            bucket[key] = bucket.get(key, 0) + 1
+
+    def roll(self, rate: float) -> bool:
+        with self.lock:
+            return rate > 0 and self.random.random() < rate
+
+    def issue_token(self) -> str:
+        with self.lock:
+            token = ".".join([
+                _b64({"alg": "none", "typ": "JWT"}),
+                _b64({"exp": int(time.time()) + self.config.token_lifetime_seconds, "n": len(self.tokens)}),
+                "benchmark",
+            ])
+            self.tokens.add(token)
+            return token
+
+    def valid_token(self, header: str) -> bool:
+        with self.lock:
+            return header.startswith("Bearer ") and header[len("Bearer "):] in self.tokens
+
+    def snapshot(self) -> dict:
+        with self.lock:
+            return {"requests": dict(self.counts), "statuses": dict(self.statuses), "tokens_issued": len(self.tokens)}
+
+    def reset_counts(self) -> None:
+        with self.lock:
+            self.counts.clear()
+            self.statuses.clear()
+
+
+def _text(size: int, seed: int) -> str:
+    words = ("zoominfo", "acquires", "expands", "announces", "funding", "product", "partnership", "growth")
+    text = " ".join(words[(seed + index) % len(words)] for index in range(size // 8 + 1))
+    return text[:size]
+
+
+def _record(fields: list[str], index: int, text_size: int) -> dict:
+    record = {"id": 1000 + index}
+    for field in fields:
+        if field == "id":
+            continue
+        if field.lower().endswith("list") or field in ("descriptionList", "companyDescriptionList"):
+            record[field] = [{"description": _text(text_size, index)}]
+        elif field.lower().endswith(("count", "revenue", "year")):
+            record[field] = index * 10
+        else:
+            record[field] = f"{field}-{index}"
+    record["emptyField"] = None
+    return record
+
+
+def _enrich_body(payload: dict, input_key: str, text_size: int) -> dict:
+    fields = payload.get("outputFields") or ["id", "name"]
+    inputs = payload.get(input_key) or [{}]
+    return {
+        "success": True,
+        "data": {
+            "outputFields": fields,
+            "result": [
+                {"input": match_input, "data": [_record(fields, index, text_size)], "matchStatus": "FULL_MATCH"}
+                for index, match_input in enumerate(inputs)
+            ]
+        }
+    }
+
+
+def _articles_body(payload: dict, state: FakeZoomInfoState, date_key: str, page_size_key: str) -> dict:
+    config = state.config
+    page = int(payload.get("page") or 1)
+    page_size = int(payload.get(page_size_key) or 10)
+    total = config.payload_items
+    start = (page - 1) * page_size
+    items = []
+    for index in range(start, min(start + page_size, total)):
+        items.append({
+            "id": index,
+            "title": f"Article {index} for company {payload.get('companyId')}",
+            "url": f"https://news.example.com/{payload.get('companyId')}/{index}",
+            date_key: (date.today() - timedelta(days=index)).isoformat(),
+            "description": _text(config.text_size, index),
+            "categories": [],
+        })
+    return {"data": items, "totalResults": total}
+
+
+class FakeZoomInfoHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server: "FakeZoomInfoServer"
+
+    def log_message(self, format, *args) -> None:
+        pass
+
+    def _send(self, status: int, body: dict, headers: dict = None) -> None:
+        encoded = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(encoded)))
+        for name, value in (headers or {}).items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(encoded)
+        self.server.state.count(f"{self.path} {status}", self.server.state.statuses)
+
+    def _sleep(self, base_ms: float) -> None:
+        config = self.server.state.config
+        delay = max(base_ms + random.uniform(-config.jitter_ms, config.jitter_ms), 0)
+        time.sleep(delay / 1000)
+
+    def do_HEAD(self) -> None:
+        self.send_response(200)
+        self.send_header("Content-Length", "0")
+        self.end_headers()
+
+    def do_POST(self) -> None:
+        state = self.server.state
+        config = state.config
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            payload = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            self._send(400, {"message": "Malformed JSON"})
+            return
+        state.count(self.path, state.counts)
+
+        if self.path == "/authenticate":
+            self._sleep(config.auth_latency_ms)
+            if not payload.get("username") or not payload.get("password"):
+                self._send(401, {"message": "Invalid credentials"})
+                return
+            self._send(200, {"jwt": state.issue_token()})
+            return
+
+        self._sleep(config.latency_ms)
+        if not state.valid_token(self.headers.get("Authorization", "")) or state.roll(config.unauthorized_rate):
+            self._send(401, {"message": "Unauthorized"})
+            return
+        if state.roll(config.rate_limit_rate):
+            self._send(429, {"message": "Too Many Requests"}, {"Retry-After": str(config.retry_after_seconds)})
+            return
+        if state.roll(config.error_rate):
+            self._send(503, {"message": "Service Unavailable"})
+            return
+
+        if self.path == "/enrich/company":
+            self._send(200, _enrich_body(payload, "matchCompanyInput", config.text_size))
+        elif self.path == "/enrich/contact":
+            self._send(200, _enrich_body(payload, "matchPersonInput", config.text_size))
+        elif self.path == "/enrich/news":
+            self._send(200, _articles_body(payload, state, "pageDate", "limit"))
+        elif self.path == "/enrich/scoop":
+            self._send(200, _articles_body(payload, state, "publishedDate", "rpp"))
+        else:
+            self._send(404, {"message": f"Unknown endpoint {self.path}"})
+
+
+class FakeZoomInfoServer(ThreadingHTTPServer):
+    daemon_threads = True
+
+    def __init__(self, config: FakeZoomInfoConfig, host: str = "127.0.0.1", port: int = 0):
+        super().__init__((host, port), FakeZoomInfoHandler)
+        self.state = FakeZoomInfoState(config)
+        self._thread = None
+
+    @property
+    def base_url(self) -> str:
+        host, port = self.server_address[:2]
+        return f"http://{host}:{port}"
+
+    def start(self) -> "FakeZoomInfoServer":
+        self._thread = threading.Thread(target=self.serve_forever, name="fake-zoominfo", daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self) -> None:
+        self.shutdown()
+        self.server_close()
+
+    def describe(self) -> dict:
+        return {"base_url": self.base_url, "config": asdict(self.state.config)}
+
+
+if __name__ == "__main__":
+    import argparse
+
+    parser = argparse.ArgumentParser(description="Run a local ZoomInfo stand-in server")
+    parser.add_argument("--port", type=int, default=8765)
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    args = parser.parse_args()
+
+    server = FakeZoomInfoServer(FakeZoomInfoConfig(latency_ms=args.latency_ms), port=args.port)
+    print(f"Fake ZoomInfo listening on {server.base_url}")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        server.stop()
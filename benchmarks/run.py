@@ -0,0 +1,223 @@
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+# Imported first, as in main.py: dify_plugin gevent-patches threading on import. Locks created before that (such as
+# concurrent.futures' shutdown lock) stay real OS locks and deadlock the patched threads, and patching while another
+# thread is running deadlocks on the import lock.
+import dify_plugin  # noqa: F401
+import json
+import time
+import platform
+import resource
+import argparse
+import importlib
+import subprocess
+import tracemalloc
+from datetime import date, datetime, timedelta, timezone
+from concurrent.futures import ThreadPoolExecutor
+
+from benchmarks.fake_zoominfo import FakeZoomInfoConfig, FakeZoomInfoServer
+from benchmarks.fake_runtime import FakeStorage, make_tool
+
+SCENARIOS = ("company", "contact", "news", "scoop", "session")
+
+TOOL_CLASSES = {
+    "company": ("tools.enrich_company", "EnrichCompanyTool"),
+    "contact": ("tools.enrich_contact", "EnrichContactTool"),
+    "news": ("tools.enrich_news", "EnrichNewsTool"),
+    "scoop": ("tools.enrich_scoop", "EnrichScoopTool"),
+}
+
+
+def tool_parameters(scenario: str, index: int, unique_inputs: bool) -> dict:
+    key = index if unique_inputs else 0
+    date_max = date.today().isoformat()
+    date_min = (date.today() - timedelta(days=90)).isoformat()
+    if scenario == "company":
+        return {"company_name": f"Benchmark Company {key}",
+                "output_fields": "id,name,website,revenue,employeeCount,descriptionList"}
+    if scenario == "contact":
+        return {"first_name": "Jane", "last_name": f"Doe {key}", "company_name": "Benchmark Company",
+                "output_fields": "id,firstName,lastName,email,jobTitle,companyName"}
+    if scenario == "news":
+        return {"company_id": 1000 + key, "limit": 10, "page": 1, "date_min": date_min, "date_max": date_max}
+    return {"company_id": 1000 + key, "rpp": 10, "page": 1, "published_start_date": date_min,
+            "published_end_date": date_max}
+
+
+def load_plugin_modules() -> dict:
+    # The plugin reads its ZOOMINFO_* settings at import time, so this runs after they are exported, and before the
+    # stand-in server's thread starts for the same reason dify_plugin is imported first.
+    importlib.import_module("utils.session_manager")
+    return {scenario: getattr(importlib.import_module(module_name), class_name)
+            for scenario, (module_name, class_name) in TOOL_CLASSES.items()}
+
+
+def percentile(values: list[float], fraction: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    rank = max(int(round(fraction * len(ordered) + 0.5)) - 1, 0)
+    return round(ordered[min(rank, len(ordered) - 1)], 2)
+
+
+def git_commit() -> str:
+    try:
+        return subprocess.run(["git", "rev-parse", "--short", "HEAD"], capture_output=True, text=True,
+                              cwd=os.path.dirname(os.path.abspath(__file__))).stdout.strip()
+    except OSError:
+        return ""
+
+
+def run_level(scenario: str, concurrency: int, invocations: int, warmup: int, server: FakeZoomInfoServer,
+              tool_classes: dict, unique_inputs: bool, storage_latency_ms: float, trace_memory: bool) -> dict:
+    storage = FakeStorage(latency_ms=storage_latency_ms)
+    # A fresh username per level keeps levels from sharing a token or rate-limit bucket; warm-up pays the first login.
+    username = f"bench-{scenario}-{concurrency}-{time.monotonic_ns()}@example.com"
+
+    if scenario == "session":
+        session_module = sys.modules["utils.session_manager"]
+
+        def invoke(index: int) -> None:
+            session_module.ZoomInfoSessionManager(username, "benchmark-password", storage).get_valid_token()
+    else:
+        tool_class = tool_classes[scenario]
+
+        def invoke(index: int) -> None:
+            tool = make_tool(tool_class, storage, username=username)
+            for _ in tool._invoke(tool_parameters(scenario, index, unique_inputs)):
+                pass
+
+    def timed(index: int) -> tuple[float, str]:
+        started = time.perf_counter()
+        try:
+            invoke(index)
+            return (time.perf_counter() - started) * 1000, ""
+        except Exception as e:
+            return (time.perf_counter() - started) * 1000, str(e)[:200]
+
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        list(executor.map(timed, range(warmup)))
+
+    server.state.reset_counts()
+    if trace_memory:
+        tracemalloc.start()
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as executor:
+        outcomes = list(executor.map(timed, range(warmup, warmup + invocations)))
+    elapsed = time.perf_counter() - started
+    peak_traced = tracemalloc.get_traced_memory()[1] if trace_memory else 0
+    if trace_memory:
+        tracemalloc.stop()
+
+    latencies = [latency for latency, _ in outcomes]
+    errors = [error for _, error in outcomes if error]
+    server_counts = server.state.snapshot()["requests"]
+    enrich_calls = sum(count for path, count in server_counts.items() if path != "/authenticate")
+
+    return {
+        "scenario": scenario,
+        "concurrency": concurrency,
+        "invocations": invocations,
+        "errors": len(errors),
+        "sample_errors": sorted(set(errors))[:3],
+        "latency_ms": {
+            "p50": percentile(latencies, 0.50),
+            "p95": percentile(latencies, 0.95),
+            "p99": percentile(latencies, 0.99),
+            "mean": round(sum(latencies) / len(latencies), 2) if latencies else 0.0,
+            "max": round(max(latencies), 2) if latencies else 0.0,
+        },
+        "invocations_per_second": round(invocations / elapsed, 2) if elapsed else 0.0,
+        "auth_calls_per_invocation": round(server_counts.get("/authenticate", 0) / invocations, 4),
+        "api_calls_per_invocation": round(enrich_calls / invocations, 4),
+        "storage_calls": dict(storage.calls),
+        "storage_bytes_used": storage.used_bytes(),
+        "peak_traced_memory_mb": round(peak_traced / (1024 * 1024), 2),
+        "peak_rss_mb": round(resource.getrusage(resource.RUSAGE_SELF).ru_maxrss / 1024, 1),
+    }
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Benchmark the ZoomInfo tools against a local stand-in server")
+    parser.add_argument("--scenarios", default="company,contact,news,scoop,session",
+                        help=f"Comma-separated subset of: {', '.join(SCENARIOS)}")
+    parser.add_argument("--concurrency", default="1,4,16", help="Comma-separated concurrency levels")
+    parser.add_argument("--invocations", type=int, default=200, help="Measured invocations per level")
+    parser.add_argument("--warmup", type=int, default=5, help="Unmeasured invocations before each level")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--jitter-ms", type=float, default=10.0)
+    parser.add_argument("--auth-latency-ms", type=float, default=150.0)
+    parser.add_argument("--error-rate", type=float, default=0.0, help="Share of enrich calls answered with 503")
+    parser.add_argument("--unauthorized-rate", type=float, default=0.0, help="Share answered with 401")
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0, help="Share answered with 429")
+    parser.add_argument("--payload-items", type=int, default=25, help="Articles per news/scoop result set")
+    parser.add_argument("--text-size", type=int, default=400, help="Characters per description field")
+    parser.add_argument("--storage-latency-ms", type=float, default=2.0)
+    parser.add_argument("--repeat-inputs", action="store_true",
+                        help="Send the same input every time, so result caches and coalescing apply")
+    parser.add_argument("--no-trace-memory", action="store_true", help="Skip tracemalloc (lower overhead)")
+    parser.add_argument("--client-rate-limit", type=float, default=1000.0,
+                        help="Client-side requests/second, high by default so the limiter does not dominate")
+    parser.add_argument("--output", default="benchmarks/results/latest.json")
+    args = parser.parse_args()
+
+    scenarios = [scenario.strip() for scenario in args.scenarios.split(",") if scenario.strip()]
+    unknown = [scenario for scenario in scenarios if scenario not in SCENARIOS]
+    if unknown:
+        parser.error(f"Unknown scenarios: {', '.join(unknown)}")
+    levels = [int(level) for level in args.concurrency.split(",") if level.strip()]
+
+    config = FakeZoomInfoConfig(
+        latency_ms=args.latency_ms, jitter_ms=args.jitter_ms, auth_latency_ms=args.auth_latency_ms,
+        error_rate=args.error_rate, unauthorized_rate=args.unauthorized_rate, rate_limit_rate=args.rate_limit_rate,
+        payload_items=args.payload_items, text_size=args.text_size)
+    # Binding picks the port, so the base URL is known before the server thread is started.
+    server = FakeZoomInfoServer(config)
+
+    # The plugin reads these at import time, so they must be set before any tool module is loaded.
+    os.environ["ZOOMINFO_API_BASE"] = server.base_url
+    os.environ["ZOOMINFO_RATE_LIMIT"] = str(args.client_rate_limit)
+    os.environ["ZOOMINFO_RATE_BURST"] = str(args.client_rate_limit)
+    os.environ.setdefault("ZOOMINFO_TOKEN_BACKGROUND_RENEWAL", "false")
+    tool_classes = load_plugin_modules()
+    server.start()
+
+    runs = []
+    try:
+        for scenario in scenarios:
+            for concurrency in levels:
+                result = run_level(scenario, concurrency, args.invocations, args.warmup, server, tool_classes,
+                                   not args.repeat_inputs, args.storage_latency_ms, not args.no_trace_memory)
+                runs.append(result)
+                print(f"{scenario:>8} c={concurrency:<3} p50={result['latency_ms']['p50']:>8}ms "
+                      f"p95={result['latency_ms']['p95']:>8}ms p99={result['latency_ms']['p99']:>8}ms "
+                      f"{result['invocations_per_second']:>8}/s auth/inv={result['auth_calls_per_invocation']} "
+                      f"errors={result['errors']}", file=sys.stderr)
+    finally:
+        server.stop()
+
+    report = {
+        "meta": {
+            "timestamp": datetime.now(timezone.utc).isoformat(),
+            "git_commit": git_commit(),
+            "python": platform.python_version(),
+            "platform": platform.platform(),
+            "arguments": vars(args),
+            "server": server.describe(),
+        },
+        "runs": runs,
+    }
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(f"Results written to {args.output}", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
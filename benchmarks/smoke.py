@@ -0,0 +1,50 @@
+import os
+import sys
+import json
+import tempfile
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# A hang is a failure too: the harness has deadlocked on import before.
+SMOKE_TIMEOUT = 300
+
+
+def run(command: list[str]) -> int:
+    try:
+        completed = subprocess.run([sys.executable] + command, cwd=ROOT, capture_output=True, text=True,
+                                   timeout=SMOKE_TIMEOUT)
+    except subprocess.TimeoutExpired:
+        print(f"FAIL {' '.join(command)}: no exit after {SMOKE_TIMEOUT}s", file=sys.stderr)
+        return 1
+    if completed.returncode != 0:
+        print(completed.stderr[-2000:], file=sys.stderr)
+        print(f"FAIL {' '.join(command)}: exit code {completed.returncode}", file=sys.stderr)
+    return completed.returncode
+
+
+def main() -> int:
+    # One tiny pass of each benchmark, so a broken harness is caught before anyone trusts its numbers.
+    with tempfile.TemporaryDirectory() as output_dir:
+        suite_output = os.path.join(output_dir, "suite.json")
+        if run(["benchmarks/run.py", "--concurrency", "1,2", "--invocations", "2", "--warmup", "1",
+                "--latency-ms", "5", "--auth-latency-ms", "5", "--no-trace-memory", "--output", suite_output]):
+            return 1
+        with open(suite_output, encoding="utf-8") as suite_file:
+            failing = [run_result for run_result in json.load(suite_file)["runs"] if run_result["errors"]]
+        for run_result in failing:
+            print(f"FAIL {run_result['scenario']} c={run_result['concurrency']}: {run_result['errors']} errors, "
+                  f"for example {run_result['sample_errors']}", file=sys.stderr)
+        if failing:
+            return 1
+
+        if run(["benchmarks/startup.py", "--runs", "1", "--profile", "0", "--latency-ms", "5",
+                "--auth-latency-ms", "5", "--output", os.path.join(output_dir, "startup.json")]):
+            return 1
+
+    print("Benchmark smoke run passed", file=sys.stderr)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
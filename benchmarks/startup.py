@@ -0,0 +1,150 @@
+import os
+import sys
+import json
+import time
+import argparse
+import statistics
+import subprocess
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, ROOT)
+
+from benchmarks.fake_zoominfo import FakeZoomInfoConfig, FakeZoomInfoServer
+
+# The modules the plugin daemon loads when a worker starts: the provider and every tool in provider/zoominfo.yaml.
+STARTUP_MODULES = (
+    "provider.zoominfo",
+    "tools.enrich_company",
+    "tools.enrich_contact",
+    "tools.enrich_news",
+    "tools.enrich_scoop",
+    "tools.batch_enrich_company",
+    "tools.batch_enrich_contact",
+)
+
+
+def child(prewarm: bool) -> None:
+    # Runs in a fresh interpreter, so every import below is cold.
+    started = time.perf_counter()
+    import importlib
+
+    imports = {}
+    for module_name in STARTUP_MODULES:
+        module_started = time.perf_counter()
+        importlib.import_module(module_name)
+        imports[module_name] = round((time.perf_counter() - module_started) * 1000, 2)
+    imported_at = time.perf_counter()
+
+    prewarm_ms = 0.0
+    if prewarm:
+        from utils.prewarm import prewarm as run_prewarm
+        prewarm_ms = run_prewarm()["elapsed_ms"]
+
+    from benchmarks.fake_runtime import FakeStorage, make_tool
+    from tools.enrich_company import EnrichCompanyTool
+
+    storage = FakeStorage(latency_ms=0)
+    parameters = {"company_name": "Startup Company", "output_fields": "id,name,website"}
+
+    def invoke(name_suffix: str) -> float:
+        invoke_started = time.perf_counter()
+        tool = make_tool(EnrichCompanyTool, storage)
+        for _ in tool._invoke({**parameters, "company_name": f"Startup Company {name_suffix}"}):
+            pass
+        return round((time.perf_counter() - invoke_started) * 1000, 2)
+
+    first = invoke("first")
+    second = invoke("second")
+    print(json.dumps({
+        "imports_ms": imports,
+        "import_total_ms": round((imported_at - started) * 1000, 2),
+        "prewarm_ms": prewarm_ms,
+        "first_invocation_ms": first,
+        "second_invocation_ms": second,
+        "time_to_first_result_ms": round((time.perf_counter() - started) * 1000 - second, 2),
+        "heavy_modules_loaded": sorted(name for name in ("requests", "httpx") if name in sys.modules),
+    }))
+
+
+def import_profile(environment: dict, top: int) -> list[dict]:
+    # -X importtime lines look like "import time:  self [us] | cumulative | imported package".
+    completed = subprocess.run([sys.executable, "-X", "importtime", "-c",
+                                "import importlib; [importlib.import_module(m) for m in %r]" % (STARTUP_MODULES,)],
+                               capture_output=True, text=True, cwd=ROOT, env=environment)
+    rows = []
+    for line in completed.stderr.splitlines():
+        if not line.startswith("import time:") or "cumulative" in line:
+            continue
+        parts = [part.strip() for part in line.split(":", 1)[1].split("|")]
+        if len(parts) != 3:
+            continue
+        self_us, cumulative_us, package = parts
+        rows.append({"module": package, "self_ms": int(self_us) / 1000, "cumulative_ms": int(cumulative_us) / 1000})
+    return sorted(rows, key=lambda row: row["cumulative_ms"], reverse=True)[:top]
+
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Measure cold-start import time and time to first invocation")
+    parser.add_argument("--runs", type=int, default=5, help="Fresh interpreters to start")
+    parser.add_argument("--prewarm", action="store_true", help="Run the startup prewarm before the first invocation")
+    parser.add_argument("--latency-ms", type=float, default=50.0)
+    parser.add_argument("--auth-latency-ms", type=float, default=150.0)
+    parser.add_argument("--profile", type=int, default=15, help="Show the N slowest imports from -X importtime")
+    parser.add_argument("--output", default="benchmarks/results/startup.json")
+    parser.add_argument("--child", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.child:
+        child(args.prewarm)
+        return 0
+
+    server = FakeZoomInfoServer(FakeZoomInfoConfig(latency_ms=args.latency_ms, jitter_ms=0,
+                                                   auth_latency_ms=args.auth_latency_ms)).start()
+    environment = {**os.environ, "ZOOMINFO_API_BASE": server.base_url, "ZOOMINFO_TOKEN_BACKGROUND_RENEWAL": "false",
+                   "PYTHONPATH": ROOT}
+    samples = []
+    try:
+        for run in range(args.runs):
+            command = [sys.executable, os.path.abspath(__file__), "--child"] + (["--prewarm"] if args.prewarm else [])
+            completed = subprocess.run(command, capture_output=True, text=True, cwd=ROOT, env=environment)
+            if completed.returncode != 0:
+                print(completed.stderr, file=sys.stderr)
+                return 1
+            samples.append(json.loads(completed.stdout.strip().splitlines()[-1]))
+            print(f"run {run + 1}: imports={samples[-1]['import_total_ms']}ms "
+                  f"first={samples[-1]['first_invocation_ms']}ms second={samples[-1]['second_invocation_ms']}ms",
+                  file=sys.stderr)
+        profile = import_profile(environment, args.profile) if args.profile else []
+    finally:
+        server.stop()
+
+    def median(key: str) -> float:
+        return round(statistics.median(sample[key] for sample in samples), 2)
+
+    report = {
+        "runs": args.runs,
+        "prewarm": args.prewarm,
+        "median_import_total_ms": median("import_total_ms"),
+        "median_first_invocation_ms": median("first_invocation_ms"),
+        "median_second_invocation_ms": median("second_invocation_ms"),
+        "median_time_to_first_result_ms": median("time_to_first_result_ms"),
+        "median_module_import_ms": {
+            module_name: round(statistics.median(sample["imports_ms"][module_name] for sample in samples), 2)
+            for module_name in STARTUP_MODULES
+        },
+        "heavy_modules_loaded": samples[-1]["heavy_modules_loaded"],
+        "slowest_imports": profile,
+        "samples": samples,
+    }
+    output_dir = os.path.dirname(args.output)
+    if output_dir:
+        os.makedirs(output_dir, exist_ok=True)
+    with open(args.output, "w", encoding="utf-8") as output_file:
+        json.dump(report, output_file, indent=2)
+    print(json.dumps({key: value for key, value in report.items() if key not in ("samples", "slowest_imports")},
+                     indent=2))
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -1,6 +1,9 @@
 from dify_plugin import Plugin, DifyPluginEnv
+from utils.prewarm import PREWARM_ENABLED, prewarm_in_background
 
 plugin = Plugin(DifyPluginEnv(MAX_REQUEST_TIMEOUT=120))
 
 if __name__ == '__main__':
+    if PREWARM_ENABLED:
+        prewarm_in_background()
     plugin.run()
@@ -1,14 +1,24 @@
+import os
 import requests
-import logging
 from typing import Any
 from dify_plugin import ToolProvider
 from dify_plugin.errors.tool import ToolProviderCredentialValidationError
-from dify_plugin.config.logger_format import plugin_logger_handler
 from utils.session_manager import ZoomInfoSessionManager
+from utils.http_client import get_http_client, api_url
+from utils.lru_cache import LruTtlCache
+from utils.rate_limiter import get_rate_limiter
+from utils.logging_setup import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logger.addHandler(plugin_logger_handler)
+logger = get_logger(__name__)
+
+CREDENTIAL_VALIDATION_TTL = float(os.getenv("ZOOMINFO_CREDENTIAL_VALIDATION_TTL", "300"))
+VALIDATION_CACHE_ENTRIES = 64
+VALIDATION_REQUEST_TIMEOUT = 10
+# Lookup endpoints are free: they confirm the token is accepted without spending an enrich credit.
+VALIDATION_CHECK_PATH = "lookup/outputfields/company/enrich"
+
+# Keyed by credential hash, so a changed password is always checked again.
+_validated_credentials = LruTtlCache(VALIDATION_CACHE_ENTRIES)
 
 
 class ZoomInfoProvider(ToolProvider):
@@ -29,8 +39,8 @@ class ZoomInfoProvider(ToolProvider):
             logger.info(f"Validating credentials for user: {username[:3]}***")
             logger.info(f"Password length: {len(password)} characters")
 
-            logger.info("Creating temporary session manager for credential validation")
-
+            # Providers get no plugin storage. The token still lands in the worker's in-process token cache,
+            # which tool invocations check before storage, so the first tool call in this worker starts warm.
             class MockStorage:
                 def get(self, key: str) -> bytes:
                     return None
@@ -43,9 +53,14 @@ class ZoomInfoProvider(ToolProvider):
 
             session_manager = ZoomInfoSessionManager(username, password, MockStorage())
 
+            if _validated_credentials.get(session_manager.cache_key):
+                logger.info("Credentials were validated recently, skipping ZoomInfo calls")
+                return
+
             logger.info("Attempting to get token for credential validation")
 
-            token = session_manager.get_valid_token()
+            # Reuses a token this worker already holds for these credentials; authenticates only on a miss.
+            token = session_manager.get_valid_token(timeout=VALIDATION_REQUEST_TIMEOUT)
 
             if not token:
                 logger.error("Failed to obtain token from ZoomInfo")
@@ -54,37 +69,25 @@ class ZoomInfoProvider(ToolProvider):
 
             logger.info(f"Token obtained successfully. Token length: {len(token)} characters")
 
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-
-            logger.info("Testing token with ZoomInfo API")
-
-            test_payload = {
-                "matchCompanyInput": [{"companyName": "Microsoft"}],
-                "outputFields": ["id", "name"]
-            }
-
-            response = requests.post(
-                "https://api.zoominfo.com/enrich/company",
-                headers=headers,
-                json=test_payload,
-                timeout=10
-            )
-
-            logger.info(f"API test response status: {response.status_code}")
+            response = self._check_token(session_manager, token)
+            if response.status_code == 401:
+                # A cached token may have been revoked; one fresh login settles whether the credentials work.
+                logger.warning("Cached token was rejected, re-authenticating once")
+                token = session_manager.refresh_token(token, timeout=VALIDATION_REQUEST_TIMEOUT)
+                response = self._check_token(session_manager, token)
 
             if response.status_code == 401:
                 logger.error(f"Token validation failed (401 Unauthorized)")
                 raise ToolProviderCredentialValidationError(
                     f"Token validation failed (401 Unauthorized). Response: {response.text[:200]}")
 
-            if response.status_code not in [200, 400, 404]:
+            # 403/404 mean the account cannot use the lookup API, but authentication has already succeeded.
+            if response.status_code not in [200, 403, 404]:
                 logger.error(f"ZoomInfo API validation failed with status {response.status_code}")
                 raise ToolProviderCredentialValidationError(
                     f"ZoomInfo API validation failed with status {response.status_code}. Response: {response.text[:200]}")
 
+            _validated_credentials.set(session_manager.cache_key, True, CREDENTIAL_VALIDATION_TTL)
             logger.info("ZoomInfo credential validation successful!")
 
         except ToolProviderCredentialValidationError:
@@ -109,3 +112,19 @@ class ZoomInfoProvider(ToolProvider):
             else:
                 raise ToolProviderCredentialValidationError(
                     f"ZoomInfo credential validation failed with unexpected error: {error_msg}")
+
+    @staticmethod
+    def _check_token(session_manager: ZoomInfoSessionManager, token: str) -> requests.Response:
+        logger.info("Testing token with ZoomInfo lookup API")
+
+        rate_limiter = get_rate_limiter(session_manager.username)
+        rate_limiter.acquire(VALIDATION_REQUEST_TIMEOUT)
+        response = get_http_client().get(
+            api_url(VALIDATION_CHECK_PATH),
+            headers={"Authorization": f"Bearer {token}", "Accept": "application/json"},
+            timeout=VALIDATION_REQUEST_TIMEOUT
+        )
+        rate_limiter.on_response(response.status_code, response.headers)
+
+        logger.info(f"API test response status: {response.status_code}")
+        return response
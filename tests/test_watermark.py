@@ -0,0 +1,68 @@
+from utils.watermark import Watermark, WatermarkStore
+
+
+class MemoryStorage(dict):
+    def get(self, key):
+        return dict.get(self, key)
+
+    def set(self, key, value):
+        self[key] = value
+
+
+def api(articles, range_start, range_end):
+    # Newest first within the date filter, as enrich/news and enrich/scoop return them.
+    matching = [item for item in articles if range_start <= item["pageDate"] <= range_end]
+    return sorted(matching, key=lambda item: item["pageDate"], reverse=True)
+
+
+def sync(watermark, articles, max_items, date_min="2026-01-01", date_max="2026-12-31"):
+    range_start, range_end = watermark.walk_range(date_min, date_max)
+    fetched = api(articles, range_start, range_end)[:max_items]
+    delivered = [item for item in fetched if watermark.is_new(item)]
+    complete = len(fetched) < max_items
+    return watermark.advanced_by(fetched, delivered, complete), [item["id"] for item in delivered]
+
+
+def test_many_items_on_the_latest_date_settle():
+    articles = [{"id": index, "pageDate": "2026-03-10"} for index in range(8)]
+    watermark, delivered = sync(Watermark("", []), articles, max_items=500)
+    assert delivered == list(range(8))
+
+    for _ in range(3):
+        watermark, delivered = sync(watermark, articles, max_items=500)
+        assert delivered == []
+
+
+def test_truncated_walk_delivers_every_item_once():
+    articles = [{"id": index, "pageDate": f"2026-03-{20 - index // 2:02d}"} for index in range(12)]
+    watermark = Watermark("", [])
+    delivered = []
+    for run in range(10):
+        if run == 2:
+            articles.append({"id": "late", "pageDate": "2026-03-25"})
+        watermark, run_delivered = sync(watermark, articles, max_items=4)
+        delivered.extend(run_delivered)
+
+    assert sorted(map(str, delivered)) == sorted(str(item["id"]) for item in articles)
+    assert watermark.resume is None
+
+
+def test_store_round_trips_the_compact_form():
+    storage = MemoryStorage()
+    store = WatermarkStore(storage, "news")
+    articles = [{"id": index, "pageDate": f"2026-03-{20 - index:02d}"} for index in range(6)]
+    watermark, _ = sync(Watermark("", []), articles, max_items=3)
+
+    assert store.advance({42: watermark}) == []
+    loaded = store.load()[42]
+    assert loaded.to_dict() == watermark.to_dict()
+    assert loaded.resume.until_ids == watermark.resume.until_ids
+
+
+def test_advance_reports_evicted_companies():
+    store = WatermarkStore(MemoryStorage(), "news", budget=64)
+    updates = {company_id: Watermark("2026-03-10", [f"{company_id:04d}"]) for company_id in range(1000, 1010)}
+
+    evicted = store.advance(updates)
+    assert evicted
+    assert set(store.load()) == set(updates) - set(evicted)
@@ -0,0 +1,205 @@
+import requests
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+from utils.session_manager import ZoomInfoSessionManager
+from utils.http_client import api_url
+from utils.retry_policy import send_with_retry, Deadline
+from utils.batch import MAX_MATCH_INPUTS, parse_list_param, chunked, match_results, map_results_to_inputs, row_outcome
+from utils.field_catalog import get_field_catalog
+from utils.metrics import instrumented, propagate_context
+from utils.async_client import async_transport_enabled, is_transport_error, send_as_completed
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+MAX_BATCH_WORKERS = 10
+# Without worker threads the in-flight cap is bounded by ZoomInfo's rate limit rather than memory.
+MAX_ASYNC_BATCH_WORKERS = 50
+
+
+class BatchEnrichCompanyTool(Tool):
+    @instrumented("batch_enrich_company")
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        logger.info("Starting ZoomInfo batch company enrichment")
+
+        try:
+            username = self.runtime.credentials["zoominfo_username"]
+            password = self.runtime.credentials["zoominfo_password"]
+            logger.info(f"Initializing ZoomInfo tool for user: {username[:3]}***")
+        except KeyError as e:
+            missing_key = str(e).strip("'")
+            logger.error(f"Missing ZoomInfo credential: {missing_key}")
+            raise Exception(
+                f"ZoomInfo credential '{missing_key}' is not configured. Please provide it in the plugin settings.")
+
+        session_manager = ZoomInfoSessionManager(username, password, self.session.storage)
+
+        company_names = parse_list_param(tool_parameters.get("company_names"))
+        company_websites = parse_list_param(tool_parameters.get("company_websites"))
+        company_ids = parse_list_param(tool_parameters.get("company_ids"))
+        output_fields_str = (tool_parameters.get("output_fields") or "").strip()
+        max_workers = tool_parameters.get("max_workers") or 4
+
+        row_count = max(len(company_names), len(company_websites), len(company_ids))
+        logger.info(f"Batch company enrichment request for {row_count} rows")
+        logger.info(f"Requested output fields: {output_fields_str}")
+
+        if row_count == 0:
+            logger.error("No companies provided")
+            raise Exception("At least one company name, website or ID must be provided.")
+
+        if not output_fields_str:
+            logger.error("Output fields parameter is empty")
+            raise Exception("Output fields cannot be empty.")
+
+        try:
+            max_workers = int(max_workers)
+            if max_workers <= 0:
+                raise ValueError("Max workers must be positive")
+        except (ValueError, TypeError):
+            logger.error(f"Invalid max workers: {max_workers}")
+            raise Exception("Max workers must be a positive integer.")
+        use_async = async_transport_enabled()
+        max_workers = min(max_workers, MAX_ASYNC_BATCH_WORKERS if use_async else MAX_BATCH_WORKERS)
+
+        try:
+            output_fields = [field.strip() for field in output_fields_str.split(",")]
+            output_fields = [field for field in output_fields if field]
+
+            if len(output_fields) == 0:
+                logger.error("No valid output fields specified")
+                raise Exception("At least one output field must be specified.")
+
+            if len(output_fields) > 5:
+                logger.error(f"Too many output fields specified: {len(output_fields)}")
+                raise Exception("Maximum 5 output fields are allowed.")
+
+            logger.info(f"Parsed output fields: {output_fields}")
+
+        except Exception as e:
+            logger.error(f"Error parsing output fields: {e}")
+            raise Exception(f"Invalid output fields format: {e}")
+
+        # Typos are rejected here, before any token or network work.
+        output_fields = get_field_catalog("company", self.session.storage).normalize(
+            output_fields, session_manager, self.session.storage)
+
+        def column_value(values: list[str], index: int) -> str:
+            return values[index] if index < len(values) else ""
+
+        rows = []
+        for index in range(row_count):
+            match_input = {}
+            if column_value(company_names, index):
+                match_input["companyName"] = column_value(company_names, index)
+            if column_value(company_websites, index):
+                match_input["companyWebsite"] = column_value(company_websites, index)
+            if column_value(company_ids, index):
+                match_input["companyId"] = column_value(company_ids, index)
+            rows.append({"row": index, "input": match_input})
+
+        results: list[dict] = [None] * row_count
+        sendable = []
+        for row in rows:
+            if row["input"]:
+                sendable.append(row)
+            else:
+                results[row["row"]] = {**row, "status": "error", "data": [],
+                                       "error": "Row has no company name, website or ID."}
+
+        chunks = chunked(sendable, MAX_MATCH_INPUTS)
+        deadline = Deadline()
+        logger.info(f"Dispatching {len(chunks)} chunks of up to {MAX_MATCH_INPUTS} companies with {max_workers} "
+                    f"in flight on the {'asyncio' if use_async else 'thread pool'} transport")
+
+        def chunk_payload(chunk: list[dict]) -> dict:
+            return {
+                "matchCompanyInput": [row["input"] for row in chunk],
+                "outputFields": output_fields
+            }
+
+        def chunk_outcome(chunk: list[dict], response: Any) -> list[dict]:
+            if response.status_code == 404:
+                return [{**row, "status": "not_found", "data": []} for row in chunk]
+            if response.status_code != 200:
+                error = f"ZoomInfo API error (status {response.status_code}): {response.text[:200]}"
+                return [{**row, "status": "error", "data": [], "error": error} for row in chunk]
+
+            matches = map_results_to_inputs([row["input"] for row in chunk], match_results(response.json()))
+            chunk_results = []
+            for row, match in zip(chunk, matches):
+                status, records, error = row_outcome(match)
+                row_result = {**row, "status": status, "data": records}
+                if error:
+                    row_result["error"] = error
+                chunk_results.append(row_result)
+            return chunk_results
+
+        def chunk_failure(chunk: list[dict], e: Exception) -> list[dict]:
+            if isinstance(e, requests.exceptions.RequestException) or is_transport_error(e):
+                logger.error(f"Network error while enriching company chunk: {str(e)}")
+                error = f"Network error while querying ZoomInfo: {str(e) or type(e).__name__}"
+            else:
+                logger.error(f"Error while enriching company chunk: {str(e)}")
+                error = str(e)
+            return [{**row, "status": "error", "data": [], "error": error} for row in chunk]
+
+        def enrich_chunk(chunk: list[dict]) -> list[dict]:
+            response = send_with_retry(session_manager, api_url("enrich/company"), chunk_payload(chunk),
+                                       deadline=deadline)
+            return chunk_outcome(chunk, response)
+
+        def completed_chunks() -> Generator[list[dict], None, None]:
+            if use_async:
+                # All chunks go out from one event loop thread instead of a thread per request.
+                requests_to_send = [(api_url("enrich/company"), chunk_payload(chunk)) for chunk in chunks]
+                for index, outcome in send_as_completed(session_manager, requests_to_send, deadline, max_workers):
+                    if isinstance(outcome, Exception):
+                        yield chunk_failure(chunks[index], outcome)
+                    else:
+                        try:
+                            yield chunk_outcome(chunks[index], outcome)
+                        except Exception as e:
+                            yield chunk_failure(chunks[index], e)
+                return
+
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zoominfo-batch-company") as executor:
+                futures = {executor.submit(propagate_context(enrich_chunk), chunk): chunk for chunk in chunks}
+                for future in as_completed(futures):
+                    try:
+                        yield future.result()
+                    except Exception as e:
+                        yield chunk_failure(futures[future], e)
+
+        try:
+            for chunk_results in completed_chunks():
+                for row_result in chunk_results:
+                    results[row_result["row"]] = row_result
+
+            matched = sum(1 for result in results if result["status"] == "matched")
+            not_found = sum(1 for result in results if result["status"] == "not_found")
+            errors = sum(1 for result in results if result["status"] == "error")
+
+            formatted_result = {
+                "requested_fields": output_fields,
+                "total": row_count,
+                "matched": matched,
+                "not_found": not_found,
+                "errors": errors,
+                "results": results,
+                "status": "success" if errors == 0 else "partial"
+            }
+
+            summary = (f"Batch company enrichment completed for {row_count} companies: "
+                       f"{matched} matched, {not_found} not found, {errors} errors.")
+            logger.info(summary)
+
+            yield self.create_text_message(summary)
+            yield self.create_json_message(formatted_result)
+
+        except Exception as e:
+            logger.error(f"Unexpected error during batch company enrichment: {str(e)}")
+            raise Exception(f"Unexpected error during batch company enrichment: {str(e)}")
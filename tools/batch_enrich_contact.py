@@ -0,0 +1,222 @@
+import requests
+from collections.abc import Generator
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Optional
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+from utils.session_manager import ZoomInfoSessionManager
+from utils.http_client import api_url
+from utils.retry_policy import send_with_retry, Deadline
+from utils.batch import (MAX_MATCH_INPUTS, parse_table_param, person_match_input, dedup_key, chunked, match_results,
+                         map_results_to_inputs, row_outcome)
+from utils.field_catalog import get_field_catalog
+from utils.metrics import instrumented, propagate_context
+from utils.async_client import async_transport_enabled, is_transport_error, send_as_completed
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+MAX_BATCH_WORKERS = 10
+# Without worker threads the in-flight cap is bounded by ZoomInfo's rate limit rather than memory.
+MAX_ASYNC_BATCH_WORKERS = 50
+
+
+class BatchEnrichContactTool(Tool):
+    @instrumented("batch_enrich_contact")
+    def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
+        logger.info("Starting ZoomInfo batch contact enrichment")
+
+        try:
+            username = self.runtime.credentials["zoominfo_username"]
+            password = self.runtime.credentials["zoominfo_password"]
+            logger.info(f"Initializing ZoomInfo tool for user: {username[:3]}***")
+        except KeyError as e:
+            missing_key = str(e).strip("'")
+            logger.error(f"Missing ZoomInfo credential: {missing_key}")
+            raise Exception(
+                f"ZoomInfo credential '{missing_key}' is not configured. Please provide it in the plugin settings.")
+
+        session_manager = ZoomInfoSessionManager(username, password, self.session.storage)
+
+        contacts = tool_parameters.get("contacts")
+        output_fields_str = (tool_parameters.get("output_fields") or "").strip()
+        max_workers = tool_parameters.get("max_workers") or 4
+
+        if not contacts or not str(contacts).strip():
+            logger.error("Contacts parameter is empty")
+            raise Exception("Contacts cannot be empty.")
+
+        if not output_fields_str:
+            logger.error("Output fields parameter is empty")
+            raise Exception("Output fields cannot be empty.")
+
+        try:
+            table = parse_table_param(contacts)
+        except Exception as e:
+            logger.error(f"Error parsing contacts table: {e}")
+            raise Exception(f"Invalid contacts format: {e}")
+
+        if not table:
+            logger.error("Contacts table has no rows")
+            raise Exception("Contacts must contain at least one row.")
+
+        try:
+            max_workers = int(max_workers)
+            if max_workers <= 0:
+                raise ValueError("Max workers must be positive")
+        except (ValueError, TypeError):
+            logger.error(f"Invalid max workers: {max_workers}")
+            raise Exception("Max workers must be a positive integer.")
+        use_async = async_transport_enabled()
+        max_workers = min(max_workers, MAX_ASYNC_BATCH_WORKERS if use_async else MAX_BATCH_WORKERS)
+
+        try:
+            output_fields = [field.strip() for field in output_fields_str.split(",")]
+            output_fields = [field for field in output_fields if field]
+
+            if len(output_fields) == 0:
+                logger.error("No valid output fields specified")
+                raise Exception("At least one output field must be specified.")
+
+            if len(output_fields) > 5:
+                logger.error(f"Too many output fields specified: {len(output_fields)}")
+                raise Exception("Maximum 5 output fields are allowed.")
+
+            logger.info(f"Parsed output fields: {output_fields}")
+
+        except Exception as e:
+            logger.error(f"Error parsing output fields: {e}")
+            raise Exception(f"Invalid output fields format: {e}")
+
+        # Typos are rejected here, before any token or network work.
+        output_fields = get_field_catalog("contact", self.session.storage).normalize(
+            output_fields, session_manager, self.session.storage)
+
+        # Identical people are sent once; every row that asked for them gets the shared result.
+        unique_inputs: dict[tuple, dict] = {}
+        rows_by_key: dict[tuple, list[int]] = {}
+        invalid_rows = []
+        for index, row in enumerate(table):
+            match_input = person_match_input(row)
+            if not match_input:
+                invalid_rows.append(index)
+                continue
+            key = dedup_key(match_input)
+            unique_inputs.setdefault(key, match_input)
+            rows_by_key.setdefault(key, []).append(index)
+
+        keys = list(unique_inputs)
+        chunks = chunked(keys, MAX_MATCH_INPUTS)
+        duplicates = len(table) - len(invalid_rows) - len(keys)
+        deadline = Deadline()
+
+        logger.info(f"Batch contact enrichment for {len(table)} rows: {len(keys)} unique contacts, "
+                    f"{duplicates} duplicates, {len(invalid_rows)} invalid rows, {len(chunks)} chunks")
+
+        def expand(key: tuple, status: str, records: list, error: Optional[str] = None) -> list[dict]:
+            expanded = []
+            for index in rows_by_key[key]:
+                row_result = {"row": index, "input": unique_inputs[key], "status": status, "data": records}
+                if error:
+                    row_result["error"] = error
+                expanded.append(row_result)
+            return expanded
+
+        def chunk_payload(chunk: list[tuple]) -> dict:
+            return {
+                "matchPersonInput": [unique_inputs[key] for key in chunk],
+                "outputFields": output_fields
+            }
+
+        def chunk_outcome(chunk: list[tuple], response: Any) -> list[dict]:
+            inputs = [unique_inputs[key] for key in chunk]
+            if response.status_code == 404:
+                return [result for key in chunk for result in expand(key, "not_found", [])]
+            if response.status_code != 200:
+                error = f"ZoomInfo API error (status {response.status_code}): {response.text[:200]}"
+                return [result for key in chunk for result in expand(key, "error", [], error)]
+
+            matches = map_results_to_inputs(inputs, match_results(response.json()))
+            chunk_results = []
+            for key, match in zip(chunk, matches):
+                status, records, error = row_outcome(match)
+                chunk_results.extend(expand(key, status, records, error))
+            return chunk_results
+
+        def chunk_failure(number: int, e: Exception) -> list[dict]:
+            if isinstance(e, requests.exceptions.RequestException) or is_transport_error(e):
+                logger.error(f"Network error while enriching contact chunk {number}: {str(e)}")
+                error = f"Network error while querying ZoomInfo: {str(e) or type(e).__name__}"
+            else:
+                logger.error(f"Error while enriching contact chunk {number}: {str(e)}")
+                error = str(e)
+            return [result for key in chunks[number - 1] for result in expand(key, "error", [], error)]
+
+        def enrich_chunk(chunk: list[tuple]) -> list[dict]:
+            response = send_with_retry(session_manager, api_url("enrich/contact"), chunk_payload(chunk),
+                                       deadline=deadline)
+            return chunk_outcome(chunk, response)
+
+        def completed_chunks() -> Generator[tuple[int, list[dict]], None, None]:
+            if use_async:
+                # All chunks go out from one event loop thread instead of a thread per request.
+                requests_to_send = [(api_url("enrich/contact"), chunk_payload(chunk)) for chunk in chunks]
+                for index, outcome in send_as_completed(session_manager, requests_to_send, deadline, max_workers):
+                    number = index + 1
+                    if isinstance(outcome, Exception):
+                        yield number, chunk_failure(number, outcome)
+                    else:
+                        try:
+                            yield number, chunk_outcome(chunks[index], outcome)
+                        except Exception as e:
+                            yield number, chunk_failure(number, e)
+                return
+
+            with ThreadPoolExecutor(max_workers=max_workers, thread_name_prefix="zoominfo-batch-contact") as executor:
+                futures = {executor.submit(propagate_context(enrich_chunk), chunk): number
+                           for number, chunk in enumerate(chunks, start=1)}
+                for future in as_completed(futures):
+                    number = futures[future]
+                    try:
+                        yield number, future.result()
+                    except Exception as e:
+                        yield number, chunk_failure(number, e)
+
+        counts = {"matched": 0, "not_found": 0, "error": 0}
+
+        if invalid_rows:
+            invalid_results = [{"row": index, "input": {}, "status": "error", "data": [],
+                                "error": "Row has no recognizable name, email, company or ID columns."}
+                               for index in invalid_rows]
+            counts["error"] += len(invalid_results)
+            yield self.create_json_message({"chunk": 0, "results": invalid_results})
+
+        try:
+            for number, chunk_results in completed_chunks():
+                for row_result in chunk_results:
+                    counts[row_result["status"]] += 1
+
+                logger.info(f"Contact chunk {number}/{len(chunks)} completed with {len(chunk_results)} rows")
+                yield self.create_json_message({"chunk": number, "results": chunk_results})
+
+            summary = (f"Batch contact enrichment completed for {len(table)} rows: {counts['matched']} matched, "
+                       f"{counts['not_found']} not found, {counts['error']} errors, "
+                       f"{duplicates} duplicate rows sent once.")
+            logger.info(summary)
+
+            yield self.create_text_message(summary)
+            yield self.create_json_message({
+                "requested_fields": output_fields,
+                "total": len(table),
+                "unique_contacts": len(keys),
+                "duplicates": duplicates,
+                "chunks": len(chunks),
+                "matched": counts["matched"],
+                "not_found": counts["not_found"],
+                "errors": counts["error"],
+                "status": "success" if counts["error"] == 0 else "partial"
+            })
+
+        except Exception as e:
+            logger.error(f"Unexpected error during batch contact enrichment: {str(e)}")
+            raise Exception(f"Unexpected error during batch contact enrichment: {str(e)}")
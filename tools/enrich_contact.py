@@ -1,18 +1,24 @@
 import requests
-import logging
 from collections.abc import Generator
 from typing import Any
 from dify_plugin import Tool
 from dify_plugin.entities.tool import ToolInvokeMessage
-from dify_plugin.config.logger_format import plugin_logger_handler
 from utils.session_manager import ZoomInfoSessionManager
+from utils.http_client import api_url
+from utils.request_coalescer import coalesced_post
+from utils.result_cache import EnrichmentResultCache, make_cache_key
+from utils.negative_cache import negative_cache_key, lookup_negative, record_negative
+from utils.field_groups import split_fields, fetch_field_groups
+from utils.field_catalog import get_field_catalog
+from utils.output_projection import parse_output_options, apply_output_mode
+from utils.metrics import instrumented, current_timings
+from utils.logging_setup import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logger.addHandler(plugin_logger_handler)
+logger = get_logger(__name__)
 
 
 class EnrichContactTool(Tool):
+    @instrumented("enrich_contact")
     def _invoke(self, tool_parameters: dict[str, Any]) -> Generator[ToolInvokeMessage, None, None]:
         logger.info("Starting ZoomInfo contact enrichment")
 
@@ -32,6 +38,10 @@ class EnrichContactTool(Tool):
         last_name = tool_parameters.get("last_name", "").strip()
         company_name = tool_parameters.get("company_name", "").strip()
         output_fields_str = tool_parameters.get("output_fields", "").strip()
+        bypass_cache = bool(tool_parameters.get("bypass_cache", False))
+        include_timings = bool(tool_parameters.get("include_timings", False))
+        output_mode, max_text_length = parse_output_options(tool_parameters.get("output_mode"),
+                                                            tool_parameters.get("max_text_length"))
 
         contact_name = f"{first_name} {last_name}".strip()
         logger.info(f"Contact enrichment request for: {contact_name} at {company_name}")
@@ -61,50 +71,34 @@ class EnrichContactTool(Tool):
                 logger.error("No valid output fields specified")
                 raise Exception("At least one output field must be specified.")
 
-            if len(output_fields) > 5:
-                logger.error(f"Too many output fields specified: {len(output_fields)}")
-                raise Exception("Maximum 5 output fields are allowed.")
-
             logger.info(f"Parsed output fields: {output_fields}")
 
         except Exception as e:
             logger.error(f"Error parsing output fields: {e}")
             raise Exception(f"Invalid output fields format: {e}")
 
-        def make_api_call(token: str) -> requests.Response:
-            headers = {
-                "Authorization": f"Bearer {token}",
-                "Content-Type": "application/json"
-            }
-
-            payload = {
-                "matchPersonInput": [{
-                    "firstName": first_name,
-                    "lastName": last_name,
-                    "companyName": company_name
-                }],
-                "outputFields": output_fields
-            }
-
+        # Typos are rejected here, before any token or network work.
+        output_fields = get_field_catalog("contact", self.session.storage).normalize(
+            output_fields, session_manager, self.session.storage)
+        field_groups = split_fields(output_fields)
+
+        match_input = {
+            "firstName": first_name,
+            "lastName": last_name,
+            "companyName": company_name
+        }
+        payload = {
+            "matchPersonInput": [match_input],
+            "outputFields": output_fields
+        }
+
+        result_cache = EnrichmentResultCache(self.session.storage, "enrich_contact")
+        cache_key = make_cache_key("enrich/contact", match_input, output_fields, username)
+        negative_key = negative_cache_key("enrich/contact", match_input, username)
+
+        def fetch_group(fields: list[str]) -> Any:
             logger.info("Making ZoomInfo API call for contact enrichment")
-            return requests.post(
-                "https://api.zoominfo.com/enrich/contact",
-                headers=headers,
-                json=payload,
-                timeout=30
-            )
-
-        try:
-            token = session_manager.get_valid_token()
-            response = make_api_call(token)
-
-            logger.info(f"ZoomInfo API response status: {response.status_code}")
-
-            if 400 <= response.status_code < 500:
-                logger.warning(f"Received {response.status_code} response, attempting token refresh")
-                token = session_manager.refresh_token()
-                response = make_api_call(token)
-                logger.info(f"Retry response status: {response.status_code}")
+            response = coalesced_post(session_manager, api_url("enrich/contact"), {**payload, "outputFields": fields})
 
             if response.status_code == 401:
                 logger.error("Unauthorized: Invalid or expired token")
@@ -112,27 +106,54 @@ class EnrichContactTool(Tool):
             elif response.status_code == 400:
                 logger.error(f"Bad request (400): {response.text[:200]}")
                 try:
-                    error_data = response.json()
-                    error_message = error_data.get('message', 'Bad Request')
-                    raise Exception(f"Invalid request: {error_message}")
-                except:
-                    raise Exception(f"Invalid request: {response.text}")
+                    error_message = f"Invalid request: {response.json().get('message', 'Bad Request')}"
+                except Exception:
+                    error_message = f"Invalid request: {response.text}"
+                if len(field_groups) == 1:
+                    # With several groups a 400 may only concern one group's fields.
+                    record_negative(negative_key, "invalid_input", error_message)
+                raise Exception(error_message)
             elif response.status_code == 404:
                 logger.warning(f"Contact '{contact_name}' at '{company_name}' not found in ZoomInfo database")
-                raise Exception(f"Contact '{contact_name}' at '{company_name}' not found in ZoomInfo database.")
+                error_message = f"Contact '{contact_name}' at '{company_name}' not found in ZoomInfo database."
+                record_negative(negative_key, "not_found", error_message)
+                raise Exception(error_message)
             elif response.status_code != 200:
                 logger.error(f"ZoomInfo API error (status {response.status_code}): {response.text[:200]}")
                 raise Exception(f"ZoomInfo API error (status {response.status_code}): {response.text}")
 
             logger.info("Parsing ZoomInfo API response")
-            result_data = response.json()
+            return response.json()
+
+        try:
+            if not bypass_cache:
+                negative_entry = lookup_negative(negative_key)
+                if negative_entry is not None:
+                    raise Exception(negative_entry[1])
+
+            result_data, cache_tier = (None, None) if bypass_cache else result_cache.get(cache_key)
+
+            if result_data is None:
+                result_data, group_status = fetch_field_groups(field_groups, fetch_group)
+                complete = all(group["status"] == "success" for group in group_status)
+
+                if complete and result_data and isinstance(result_data, dict):
+                    result_cache.set(cache_key, result_data)
+            else:
+                group_status = [{"fields": group, "status": "success"} for group in field_groups]
+                complete = True
 
             formatted_result = {
                 "contact_name": contact_name,
                 "company_name": company_name,
                 "requested_fields": output_fields,
                 "data": result_data,
-                "status": "success"
+                "cache": {
+                    "hit": cache_tier is not None,
+                    "tier": cache_tier
+                },
+                "field_groups": group_status,
+                "status": "success" if complete else "partial"
             }
 
             if result_data and isinstance(result_data, dict):
@@ -143,7 +164,10 @@ class EnrichContactTool(Tool):
                 logger.info(f"Contact enrichment completed but no data found for: {contact_name} at {company_name}")
 
             yield self.create_text_message(summary)
-            yield self.create_json_message(formatted_result)
+            if include_timings:
+                formatted_result["timings"] = current_timings()
+            yield self.create_json_message(
+                apply_output_mode(formatted_result, output_mode, max_text_length, output_fields))
 
         except requests.exceptions.RequestException as e:
             logger.error(f"Network error while querying ZoomInfo: {str(e)}")
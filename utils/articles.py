@@ -0,0 +1,461 @@
+import requests
+from collections.abc import Generator
+from typing import Any
+from datetime import datetime
+from dify_plugin import Tool
+from dify_plugin.entities.tool import ToolInvokeMessage
+from utils.session_manager import ZoomInfoSessionManager
+from utils.http_client import api_url
+from utils.request_coalescer import coalesced_post
+from utils.pagination import iter_pages, page_items
+from utils.retry_policy import Deadline
+from utils.date_shards import split_date_range, fetch_shards, merge_by_date
+from utils.fanout import fan_out
+from utils.batch import parse_list_param
+from utils.watermark import WatermarkStore, Watermark
+from utils.dedup import ArticleDeduper
+from utils.output_projection import parse_output_options, apply_output_mode
+from utils.metrics import current_timings
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_MAX_ITEMS = 500
+
+
+class ArticleEndpoint:
+    # The news and scoop endpoints differ only in path and in the names of their page size and date filters.
+    def __init__(self, name: str, path: str, limit_key: str, date_min_key: str, date_max_key: str,
+                 limit_params: tuple = ("limit",), date_min_params: tuple = ("date_min",),
+                 date_max_params: tuple = ("date_max",)):
+        self.name = name
+        self.path = path
+        self.limit_key = limit_key
+        self.date_min_key = date_min_key
+        self.date_max_key = date_max_key
+        self.limit_params = limit_params
+        self.date_min_params = date_min_params
+        self.date_max_params = date_max_params
+
+    @staticmethod
+    def parameter(tool_parameters: dict[str, Any], names: tuple) -> Any:
+        for parameter_name in names:
+            value = tool_parameters.get(parameter_name)
+            if value is not None and value != "":
+                return value
+        return None
+
+
+NEWS_ENDPOINT = ArticleEndpoint("news", "enrich/news", "limit", "pageDateMin", "pageDateMax")
+SCOOP_ENDPOINT = ArticleEndpoint("scoop", "enrich/scoop", "rpp", "publishedStartDate", "publishedEndDate",
+                                 limit_params=("rpp", "limit"),
+                                 date_min_params=("published_start_date", "date_min"),
+                                 date_max_params=("published_end_date", "date_max"))
+
+
+def invoke_articles(tool: Tool, tool_parameters: dict[str, Any],
+                    endpoint: ArticleEndpoint) -> Generator[ToolInvokeMessage, None, None]:
+    name = endpoint.name
+    title = name.capitalize()
+    logger.info(f"Starting ZoomInfo {name} enrichment")
+
+    try:
+        username = tool.runtime.credentials["zoominfo_username"]
+        password = tool.runtime.credentials["zoominfo_password"]
+        logger.info(f"Initializing ZoomInfo tool for user: {username[:3]}***")
+    except KeyError as e:
+        missing_key = str(e).strip("'")
+        logger.error(f"Missing ZoomInfo credential: {missing_key}")
+        raise Exception(
+            f"ZoomInfo credential '{missing_key}' is not configured. Please provide it in the plugin settings.")
+
+    session_manager = ZoomInfoSessionManager(username, password, tool.session.storage)
+
+    company_id = tool_parameters.get("company_id")
+    company_ids = parse_list_param(tool_parameters.get("company_ids"), comma_separated=True)
+    limit = endpoint.parameter(tool_parameters, endpoint.limit_params)
+    page = tool_parameters.get("page")
+    date_min = (endpoint.parameter(tool_parameters, endpoint.date_min_params) or "").strip()
+    date_max = (endpoint.parameter(tool_parameters, endpoint.date_max_params) or "").strip()
+    fetch_all_pages = bool(tool_parameters.get("fetch_all_pages", False))
+    max_items = tool_parameters.get("max_items") or DEFAULT_MAX_ITEMS
+    shard_by = (tool_parameters.get("shard_by") or "none").strip().lower()
+    max_workers = tool_parameters.get("max_workers") or 4
+    incremental = bool(tool_parameters.get("incremental", False))
+    include_timings = bool(tool_parameters.get("include_timings", False))
+    output_mode, max_text_length = parse_output_options(tool_parameters.get("output_mode"),
+                                                        tool_parameters.get("max_text_length"))
+
+    logger.info(f"{title} enrichment request for company ID: {company_id}")
+    logger.info(f"Parameters - limit: {limit}, page: {page}, date range: {date_min} to {date_max}")
+
+    if company_id is None and not company_ids:
+        logger.error("Company ID parameter is missing")
+        raise Exception("Company ID cannot be empty.")
+
+    if limit is None:
+        logger.error("Limit parameter is missing")
+        raise Exception("Limit cannot be empty.")
+
+    if page is None:
+        logger.error("Page parameter is missing")
+        raise Exception("Page cannot be empty.")
+
+    if not date_min:
+        logger.error("Start date parameter is empty")
+        raise Exception("Start date cannot be empty.")
+
+    if not date_max:
+        logger.error("End date parameter is empty")
+        raise Exception("End date cannot be empty.")
+
+    try:
+        if company_id is not None:
+            company_id = int(company_id)
+            if company_id <= 0:
+                raise ValueError("Company ID must be positive")
+        company_ids = list(dict.fromkeys(int(float(value)) for value in company_ids if value))
+        if any(value <= 0 for value in company_ids):
+            raise ValueError("Company IDs must be positive")
+    except (ValueError, TypeError):
+        logger.error(f"Invalid company ID: {company_id}")
+        raise Exception("Company ID must be a positive integer.")
+
+    try:
+        limit = int(limit)
+        if limit <= 0:
+            raise ValueError("Limit must be positive")
+    except (ValueError, TypeError):
+        logger.error(f"Invalid limit: {limit}")
+        raise Exception("Limit must be a positive integer.")
+
+    try:
+        page = int(page)
+        if page <= 0:
+            raise ValueError("Page must be positive")
+    except (ValueError, TypeError):
+        logger.error(f"Invalid page: {page}")
+        raise Exception("Page must be a positive integer.")
+
+    try:
+        max_items = int(max_items)
+        if max_items <= 0:
+            raise ValueError("Max items must be positive")
+    except (ValueError, TypeError):
+        logger.error(f"Invalid max items: {max_items}")
+        raise Exception("Max items must be a positive integer.")
+
+    try:
+        start_date = datetime.strptime(date_min, '%Y-%m-%d').date()
+        end_date = datetime.strptime(date_max, '%Y-%m-%d').date()
+    except ValueError:
+        logger.error(f"Invalid date format: {date_min} or {date_max}")
+        raise Exception("Dates must be in YYYY-MM-DD format.")
+
+    try:
+        max_workers = int(max_workers)
+        if max_workers <= 0:
+            raise ValueError("Max workers must be positive")
+    except (ValueError, TypeError):
+        logger.error(f"Invalid max workers: {max_workers}")
+        raise Exception("Max workers must be a positive integer.")
+
+    if shard_by != "none" and start_date > end_date:
+        logger.error(f"Start date {date_min} is after end date {date_max}")
+        raise Exception("Start date must not be after end date.")
+
+    shards = split_date_range(start_date, end_date, shard_by)
+    sharded = shard_by != "none"
+
+    if company_ids and company_id is not None and company_id not in company_ids:
+        company_ids.insert(0, company_id)
+
+    deadline = Deadline()
+    watermarks = WatermarkStore(tool.session.storage, name)
+    known_watermarks = watermarks.load() if incremental else {}
+    watermark_updates: dict[int, Watermark] = {}
+
+    def fetch_page(target_company_id: int, page_number: int, range_start: str = date_min,
+                   range_end: str = date_max, allow_empty: bool = False) -> Any:
+        payload = {
+            "companyId": target_company_id,
+            endpoint.limit_key: limit,
+            "page": page_number,
+            endpoint.date_min_key: range_start,
+            endpoint.date_max_key: range_end
+        }
+
+        logger.info(f"Making ZoomInfo API call for {name} enrichment (page {page_number})")
+        response = coalesced_post(session_manager, api_url(endpoint.path), payload, deadline=deadline)
+
+        if response.status_code == 401:
+            logger.error("Unauthorized: Invalid or expired token")
+            raise Exception("Unauthorized: Invalid or expired token. Please check your credentials.")
+        elif response.status_code == 400:
+            logger.error(f"Bad request (400): {response.text[:200]}")
+            try:
+                error_message = f"Invalid request: {response.json().get('message', 'Bad Request')}"
+            except Exception:
+                error_message = f"Invalid request: {response.text}"
+            raise Exception(error_message)
+        elif response.status_code == 404:
+            if allow_empty or (fetch_all_pages and page_number > page):
+                # An empty shard, or walked past the last page of the result set.
+                return {}
+            logger.warning(f"No {name} found for company ID {target_company_id}")
+            raise Exception(f"No {name} found for company ID {target_company_id}.")
+        elif response.status_code != 200:
+            logger.error(f"ZoomInfo API error (status {response.status_code}): {response.text[:200]}")
+            raise Exception(f"ZoomInfo API error (status {response.status_code}): {response.text}")
+
+        logger.info("Parsing ZoomInfo API response")
+        return response.json()
+
+    def fetch_shard(target_company_id: int, range_start: str, range_end: str) -> list:
+        items = []
+        for _, _, shard_items in iter_pages(
+                lambda page_number: fetch_page(target_company_id, page_number, range_start, range_end, True),
+                1, limit, max_items, prefetch=0):
+            items.extend(shard_items)
+        return items
+
+    def dedup_page(result_data: Any, deduper: ArticleDeduper) -> Any:
+        # Copy rather than edit in place: coalesced responses are shared with other invocations.
+        if isinstance(result_data, dict) and isinstance(result_data.get("data"), list):
+            return {**result_data, "data": deduper.unique(result_data["data"])}
+        return result_data
+
+    def fetch_company(target_company_id: int, shard_workers: int, deduper: ArticleDeduper) -> Any:
+        if sharded:
+            shard_items = fetch_shards(
+                shards, lambda range_start, range_end: fetch_shard(target_company_id, range_start, range_end),
+                shard_workers)
+            merged = deduper.unique(merge_by_date(shard_items))[:max_items]
+            return {"data": merged, "totalResults": len(merged)}
+        if fetch_all_pages:
+            items = []
+            for _, _, company_items in iter_pages(
+                    lambda page_number: fetch_page(target_company_id, page_number), page, limit, max_items):
+                items.extend(deduper.unique(company_items))
+            return {"data": items, "totalResults": len(items)}
+        return dedup_page(fetch_page(target_company_id, page), deduper)
+
+    def fetch_incremental(target_company_id: int, deduper: ArticleDeduper) -> dict:
+        watermark = known_watermarks.get(target_company_id)
+        range_start, range_end = (watermark or Watermark("", [])).walk_range(date_min, date_max)
+        items = []
+        if range_start <= range_end:
+            for _, _, page_items_fetched in iter_pages(
+                    lambda page_number: fetch_page(target_company_id, page_number, range_start, range_end, True),
+                    1, limit, max_items):
+                items.extend(page_items_fetched)
+
+        delta = deduper.unique([item for item in items if watermark is None or watermark.is_new(item)])
+
+        # A walk cut short by max_items still advances past what it delivered, and leaves a resume cursor for the
+        # older items it did not reach; the next runs drain those before moving on, so nothing is sent twice or lost.
+        complete = len(items) < max_items
+        advanced = (watermark or Watermark("", [])).advanced_by(items, delta, complete)
+        if delta or not complete or (watermark is not None and watermark.resume is not None):
+            watermark_updates[target_company_id] = advanced
+        else:
+            advanced = watermark
+        logger.info(f"Incremental {name} sync for company ID {target_company_id}: "
+                    f"{len(delta)} new of {len(items)} fetched between {range_start} and {range_end}")
+
+        return {
+            "data": {"data": delta, "totalResults": len(delta)},
+            "incremental": {
+                "since": watermark.to_dict() if watermark else None,
+                "watermark": advanced.to_dict() if advanced else None,
+                "new_items": len(delta),
+                "complete": complete
+            }
+        }
+
+    try:
+        deduper = ArticleDeduper()
+
+        if company_ids:
+            def enrich_one(target_company_id: int) -> dict:
+                deduper = ArticleDeduper()
+                try:
+                    if incremental:
+                        synced = fetch_incremental(target_company_id, deduper)
+                        return {"status": "success", "count": synced["incremental"]["new_items"],
+                                "duplicates_dropped": deduper.dropped, **synced}
+                    result_data = fetch_company(target_company_id, 1, deduper)
+                    return {"status": "success", "count": len(page_items(result_data)),
+                            "duplicates_dropped": deduper.dropped, "data": result_data}
+                except Exception as e:
+                    status = "not_found" if str(e).startswith(f"No {name} found") else "error"
+                    return {"status": status, "error": str(e)}
+
+            results = fan_out(company_ids, enrich_one, max_workers)
+            evicted = watermarks.advance(watermark_updates)
+            succeeded = sum(1 for result in results.values() if result["status"] == "success")
+            not_found = sum(1 for result in results.values() if result["status"] == "not_found")
+            failed = sum(1 for result in results.values() if result["status"] == "error")
+            duplicates_dropped = sum(result.get("duplicates_dropped", 0) for result in results.values())
+
+            formatted_result = {
+                "company_ids": company_ids,
+                "limit": limit,
+                "page": page,
+                "date_range": {
+                    "start": date_min,
+                    "end": date_max
+                },
+                "results": {str(key): result for key, result in results.items()},
+                "succeeded": succeeded,
+                "not_found": not_found,
+                "failed": failed,
+                "duplicates_dropped": duplicates_dropped,
+                "status": "success" if failed == 0 else "partial"
+            }
+            if incremental:
+                formatted_result["watermark_evicted"] = evicted
+
+            summary = (f"{title} enrichment completed for {len(company_ids)} companies: {succeeded} succeeded, "
+                       f"{not_found} with no {name}, {failed} failed.")
+            logger.info(summary)
+            yield tool.create_text_message(summary)
+            if include_timings:
+                formatted_result["timings"] = current_timings()
+            yield tool.create_json_message(apply_output_mode(formatted_result, output_mode, max_text_length))
+            return
+
+        if incremental:
+            synced = fetch_incremental(company_id, deduper)
+            evicted = watermarks.advance(watermark_updates)
+
+            formatted_result = {
+                "company_id": company_id,
+                "limit": limit,
+                "date_range": {
+                    "start": date_min,
+                    "end": date_max
+                },
+                "incremental": synced["incremental"],
+                "data": synced["data"],
+                "duplicates_dropped": deduper.dropped,
+                # Companies whose watermark no longer fit the storage budget; their next run starts from date_min.
+                "watermark_evicted": evicted,
+                "status": "success"
+            }
+
+            summary = (f"{title} enrichment completed for company ID {company_id}. "
+                       f"Found {synced['incremental']['new_items']} new {name} items since the last sync.")
+            logger.info(summary)
+            yield tool.create_text_message(summary)
+            if include_timings:
+                formatted_result["timings"] = current_timings()
+            yield tool.create_json_message(apply_output_mode(formatted_result, output_mode, max_text_length))
+            return
+
+        if sharded:
+            merged = page_items(fetch_company(company_id, max_workers, deduper))
+
+            formatted_result = {
+                "company_id": company_id,
+                "limit": limit,
+                "date_range": {
+                    "start": date_min,
+                    "end": date_max
+                },
+                "shard_by": shard_by,
+                "shards": len(shards),
+                "data": {
+                    "data": merged,
+                    "totalResults": len(merged)
+                },
+                "duplicates_dropped": deduper.dropped,
+                "status": "success"
+            }
+
+            summary = (f"{title} enrichment completed for company ID {company_id}. "
+                       f"Found {len(merged)} {name} articles across {len(shards)} {shard_by} shards.")
+            logger.info(summary)
+            yield tool.create_text_message(summary)
+            if include_timings:
+                formatted_result["timings"] = current_timings()
+            yield tool.create_json_message(apply_output_mode(formatted_result, output_mode, max_text_length))
+            return
+
+        if fetch_all_pages:
+            pages_fetched = 0
+            items_fetched = 0
+            for page_number, result_data, items in iter_pages(
+                    lambda page_number: fetch_page(company_id, page_number), page, limit, max_items):
+                pages_fetched += 1
+                items = deduper.unique(items)
+                items_fetched += len(items)
+                page_data = {**result_data, "data": items} if isinstance(result_data, dict) else result_data
+                yield tool.create_json_message(apply_output_mode({
+                    "company_id": company_id,
+                    "limit": limit,
+                    "page": page_number,
+                    "date_range": {
+                        "start": date_min,
+                        "end": date_max
+                    },
+                    "data": page_data,
+                    "duplicates_dropped": deduper.dropped,
+                    "status": "success"
+                }, output_mode, max_text_length))
+
+            summary = (f"{title} enrichment completed for company ID {company_id}. "
+                       f"Found {items_fetched} {name} articles across {pages_fetched} pages, "
+                       f"dropping {deduper.dropped} duplicates.")
+            logger.info(summary)
+            yield tool.create_text_message(summary)
+            if include_timings:
+                # Pages were already streamed, so the timings for the whole walk follow the summary on their own.
+                yield tool.create_json_message({
+                    "company_id": company_id,
+                    "pages_fetched": pages_fetched,
+                    "items_fetched": items_fetched,
+                    "duplicates_dropped": deduper.dropped,
+                    "timings": current_timings()
+                })
+            return
+
+        result_data = dedup_page(fetch_page(company_id, page), deduper)
+
+        formatted_result = {
+            "company_id": company_id,
+            "limit": limit,
+            "page": page,
+            "date_range": {
+                "start": date_min,
+                "end": date_max
+            },
+            "data": result_data,
+            "duplicates_dropped": deduper.dropped,
+            "status": "success"
+        }
+
+        if result_data and isinstance(result_data, dict):
+            article_count = len(result_data.get('data', []))
+            summary = (f"{title} enrichment completed successfully for company ID {company_id}. "
+                       f"Found {article_count} {name} articles.")
+            logger.info(
+                f"{title} enrichment completed successfully for company ID {company_id}, found {article_count} articles")
+        else:
+            summary = f"{title} enrichment completed but no {name} found for company ID {company_id}."
+            logger.info(f"{title} enrichment completed but no {name} found for company ID {company_id}")
+
+        yield tool.create_text_message(summary)
+        if include_timings:
+            formatted_result["timings"] = current_timings()
+        yield tool.create_json_message(apply_output_mode(formatted_result, output_mode, max_text_length))
+
+    except requests.exceptions.RequestException as e:
+        logger.error(f"Network error while querying ZoomInfo: {str(e)}")
+        raise Exception(f"Network error while querying ZoomInfo: {str(e)}")
+    except Exception as e:
+        if "Invalid request" in str(e) or "Unauthorized" in str(e) or "ZoomInfo API error" in str(e):
+            raise e
+        else:
+            logger.error(f"Unexpected error during {name} enrichment: {str(e)}")
+            raise Exception(f"Unexpected error during {name} enrichment: {str(e)}")
@@ -0,0 +1,296 @@
+import os
+import time
+import queue
+import asyncio
+import threading
+import contextvars
+import importlib.util
+from concurrent.futures import Future
+from collections.abc import Iterator
+from typing import Any, Awaitable, Optional
+from urllib.parse import urlparse
+from utils.http_client import DEFAULT_POOL_MAXSIZE
+from utils.rate_limiter import get_rate_limiter
+from utils.circuit_breaker import get_circuit_breaker
+from utils.retry_policy import (RetryPolicy, Deadline, DEFAULT_RETRY_POLICY, RETRY, REAUTHENTICATE, RAISE,
+                                next_step, check_budget, record_response, log_step)
+from utils.metrics import registry, record_phase, timed_phase, current_tool
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+ASYNC_TRANSPORT = os.getenv("ZOOMINFO_ASYNC_TRANSPORT", "true").lower() in ("1", "true", "yes")
+ASYNC_MAX_IN_FLIGHT = int(os.getenv("ZOOMINFO_ASYNC_MAX_IN_FLIGHT", "100"))
+ASYNC_MAX_CONNECTIONS = int(os.getenv("ZOOMINFO_ASYNC_MAX_CONNECTIONS", str(DEFAULT_POOL_MAXSIZE)))
+
+
+# httpx is only imported once an asyncio request is actually sent, so it stays off the cold-start path.
+HTTPX_INSTALLED = importlib.util.find_spec("httpx") is not None
+_httpx = None
+
+
+def load_httpx():
+    global _httpx
+    if _httpx is None:
+        import httpx
+        _httpx = httpx
+    return _httpx
+
+
+def async_transport_enabled() -> bool:
+    return ASYNC_TRANSPORT and HTTPX_INSTALLED
+
+
+def is_transport_error(e: Exception) -> bool:
+    return _httpx is not None and isinstance(e, _httpx.HTTPError)
+
+
+class _EventLoopThread:
+    # One long-lived loop on a daemon thread; sync code hands it coroutines and blocks on the result.
+    def __init__(self):
+        self._loop: Optional[asyncio.AbstractEventLoop] = None
+        self._lock = threading.Lock()
+
+    def _ensure_loop(self) -> asyncio.AbstractEventLoop:
+        with self._lock:
+            if self._loop is None or self._loop.is_closed():
+                loop = asyncio.new_event_loop()
+                thread = threading.Thread(target=loop.run_forever, name="zoominfo-async", daemon=True)
+                thread.start()
+                self._loop = loop
+            return self._loop
+
+    def submit(self, coro: Awaitable) -> Future:
+        loop = self._ensure_loop()
+        # Tasks copy the caller's context so phase timings land on the invoking tool.
+        context = contextvars.copy_context()
+        result: Future = Future()
+
+        def start() -> None:
+            task = loop.create_task(coro, context=context)
+
+            def done(finished: asyncio.Task) -> None:
+                if finished.cancelled():
+                    result.cancel()
+                elif finished.exception() is not None:
+                    result.set_exception(finished.exception())
+                else:
+                    result.set_result(finished.result())
+
+            task.add_done_callback(done)
+
+        loop.call_soon_threadsafe(start)
+        return result
+
+    def run(self, coro: Awaitable, timeout: Optional[float] = None) -> Any:
+        if threading.current_thread().name == "zoominfo-async":
+            raise RuntimeError("Cannot block on the ZoomInfo event loop from inside it")
+        return self.submit(coro).result(timeout)
+
+
+_loop_thread = _EventLoopThread()
+
+
+def run_sync(coro: Awaitable, timeout: Optional[float] = None) -> Any:
+    return _loop_thread.run(coro, timeout)
+
+
+class AsyncZoomInfoClient:
+    def __init__(self, max_connections: int = ASYNC_MAX_CONNECTIONS, max_in_flight: int = ASYNC_MAX_IN_FLIGHT):
+        self.max_connections = max_connections
+        self.max_in_flight = max_in_flight
+        # Created lazily on the loop thread: httpx and asyncio primitives bind to the loop that first uses them.
+        self._client = None
+        self._host_limits: dict[str, asyncio.Semaphore] = {}
+
+    def _get_client(self):
+        if self._client is None:
+            httpx = load_httpx()
+            self._client = httpx.AsyncClient(
+                limits=httpx.Limits(max_connections=self.max_connections,
+                                    max_keepalive_connections=self.max_connections))
+            logger.info(f"Initialized asyncio ZoomInfo HTTP client (max_connections={self.max_connections}, "
+                        f"max_in_flight={self.max_in_flight})")
+        return self._client
+
+    def _host_limit(self, url: str) -> asyncio.Semaphore:
+        host = urlparse(url).netloc
+        semaphore = self._host_limits.get(host)
+        if semaphore is None:
+            semaphore = asyncio.Semaphore(self.max_in_flight)
+            self._host_limits[host] = semaphore
+        return semaphore
+
+    async def request(self, method: str, url: str, **kwargs):
+        async with self._host_limit(url):
+            return await self._get_client().request(method, url, **kwargs)
+
+    async def post(self, url: str, **kwargs):
+        return await self.request("POST", url, **kwargs)
+
+    async def get(self, url: str, **kwargs):
+        return await self.request("GET", url, **kwargs)
+
+    async def aclose(self) -> None:
+        if self._client is not None:
+            await self._client.aclose()
+            self._client = None
+
+
+_async_client: Optional[AsyncZoomInfoClient] = None
+_async_client_lock = threading.Lock()
+
+
+def get_async_client() -> AsyncZoomInfoClient:
+    global _async_client
+    if _async_client is None:
+        with _async_client_lock:
+            if _async_client is None:
+                _async_client = AsyncZoomInfoClient()
+    return _async_client
+
+
+async def async_send_with_retry(session_manager, url: str, payload: dict, policy: Optional[RetryPolicy] = None,
+                                deadline: Optional[Deadline] = None):
+    httpx = load_httpx()
+    policy = policy or DEFAULT_RETRY_POLICY
+    deadline = deadline or Deadline()
+    rate_limiter = get_rate_limiter(session_manager.username)
+    circuit_breaker = get_circuit_breaker(url)
+    endpoint = urlparse(url).path or url
+    tool = current_tool()
+    reauthenticated = False
+    attempt = 0
+
+    while True:
+        attempt += 1
+        check_budget(policy, deadline, url)
+
+        # Tokens come from the in-memory cache almost every time, read right here on the loop; only a miss pays for a
+        # worker thread to do the storage read or login.
+        with timed_phase("token"):
+            token = session_manager.cached_token()
+            if not token:
+                token = await asyncio.to_thread(session_manager.get_valid_token,
+                                                timeout=deadline.timeout(policy.attempt_timeout))
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+
+        # An open breaker fails fast before the call takes a rate-limit slot.
+        circuit_breaker.before_call()
+        try:
+            waited = await rate_limiter.acquire_async(deadline.remaining() - policy.min_attempt_timeout)
+        except BaseException:
+            circuit_breaker.release()
+            raise
+        if waited:
+            record_phase("rate_limit_wait", waited * 1000, endpoint=endpoint)
+
+        try:
+            with timed_phase("http", endpoint=endpoint):
+                response = await get_async_client().post(
+                    url,
+                    headers=headers,
+                    json=payload,
+                    timeout=deadline.timeout(policy.attempt_timeout)
+                )
+        except (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout) as e:
+            circuit_breaker.record_failure()
+            registry.inc("zoominfo_requests_total", endpoint=endpoint, status="connection_error", tool=tool)
+            action, delay = next_step(policy, attempt, deadline, reauthenticated)
+            log_step(action, delay, attempt, url, endpoint, tool, error=e)
+            if action == RAISE:
+                raise
+            await asyncio.sleep(delay)
+            continue
+        except httpx.HTTPError as e:
+            circuit_breaker.record_failure()
+            registry.inc("zoominfo_requests_total", endpoint=endpoint, status=type(e).__name__, tool=tool)
+            raise
+        except asyncio.CancelledError:
+            # A cancelled call has no outcome to report, so it must not keep the probe slot either.
+            circuit_breaker.release()
+            raise
+
+        record_response(response, attempt, endpoint, tool, circuit_breaker, rate_limiter)
+        action, delay = next_step(policy, attempt, deadline, reauthenticated, response)
+        log_step(action, delay, attempt, url, endpoint, tool, response)
+        if action == REAUTHENTICATE:
+            with timed_phase("token_refresh"):
+                await asyncio.to_thread(session_manager.refresh_token, token,
+                                        timeout=deadline.timeout(policy.attempt_timeout))
+            reauthenticated = True
+            continue
+        if action == RETRY:
+            await asyncio.sleep(delay)
+            continue
+        return response
+
+
+def send_as_completed(session_manager, requests: list[tuple[str, dict]], deadline: Optional[Deadline] = None,
+                      max_in_flight: int = ASYNC_MAX_IN_FLIGHT) -> Iterator[tuple[int, Any]]:
+    # Sync bridge for the tools: every POST runs on the shared event loop and (index, response) pairs come back
+    # as they finish. A failed request yields its exception instead of aborting the others, and when the budget runs
+    # out every request that has not finished yields a timeout exception, so completed results are never lost.
+    deadline = deadline or Deadline()
+    finished: queue.Queue = queue.Queue()
+    started = time.monotonic()
+    sends: list[asyncio.Task] = []
+
+    async def send_all() -> None:
+        semaphore = asyncio.Semaphore(max(1, max_in_flight))
+
+        async def send(index: int, url: str, payload: dict) -> None:
+            async with semaphore:
+                try:
+                    outcome = await async_send_with_retry(session_manager, url, payload, deadline=deadline)
+                except Exception as e:
+                    outcome = e
+            finished.put((index, outcome))
+
+        sends.extend(asyncio.ensure_future(send(index, url, payload)) for index, (url, payload) in enumerate(requests))
+        await asyncio.gather(*sends)
+
+    async def cancel_pending() -> None:
+        # Runs on the loop after send_all has started, so every send task already exists.
+        pending = [task for task in sends if not task.done()]
+        for task in pending:
+            task.cancel()
+        await asyncio.gather(*pending, return_exceptions=True)
+        if pending:
+            logger.info(f"Cancelled {len(pending)} unfinished requests on the asyncio transport")
+
+    _loop_thread.submit(send_all())
+    delivered: set[int] = set()
+    try:
+        while len(delivered) < len(requests):
+            try:
+                index, outcome = finished.get(timeout=deadline.remaining() + 1)
+            except queue.Empty:
+                break
+            delivered.add(index)
+            yield index, outcome
+    finally:
+        # The consumer stopped early or the budget ran out: stop the requests still queued or in flight rather than
+        # let them spend rate-limit slots on results nobody will read.
+        if len(delivered) < len(requests):
+            _loop_thread.run(cancel_pending(), timeout=max(deadline.remaining(), 1))
+
+    if len(delivered) < len(requests):
+        # Requests that finished while the rest were being cancelled still count.
+        while not finished.empty():
+            index, outcome = finished.get_nowait()
+            delivered.add(index)
+            yield index, outcome
+        unfinished = [index for index in range(len(requests)) if index not in delivered]
+        logger.warning(f"Request budget of {deadline.budget:.0f} seconds exhausted with {len(unfinished)} of "
+                       f"{len(requests)} requests unfinished on the asyncio transport")
+        for index in unfinished:
+            yield index, Exception(f"ZoomInfo API error: request budget of {deadline.budget:.0f} seconds exhausted "
+                                   f"before this request completed")
+        return
+
+    logger.info(f"Sent {len(requests)} requests on the asyncio transport with up to {max_in_flight} in flight "
+                f"in {time.monotonic() - started:.2f}s")
@@ -0,0 +1,147 @@
+import csv
+import io
+import json
+from typing import Any, Optional
+
+# ZoomInfo accepts at most 25 match inputs per enrich request.
+MAX_MATCH_INPUTS = 25
+
+NOT_FOUND_MATCH_STATUSES = {"NO_MATCH", "NOT_FOUND"}
+
+PERSON_INPUT_ALIASES = {
+    "firstname": "firstName",
+    "first": "firstName",
+    "lastname": "lastName",
+    "last": "lastName",
+    "fullname": "fullName",
+    "name": "fullName",
+    "email": "emailAddress",
+    "emailaddress": "emailAddress",
+    "companyname": "companyName",
+    "company": "companyName",
+    "companyid": "companyId",
+    "personid": "personId",
+    "jobtitle": "jobTitle",
+    "title": "jobTitle",
+}
+
+
+def parse_list_param(value: Any, comma_separated: bool = False) -> list[str]:
+    if value is None:
+        return []
+    if isinstance(value, (list, tuple)):
+        return [str(item).strip() for item in value]
+
+    text = str(value).strip()
+    if not text:
+        return []
+
+    if text.startswith("["):
+        try:
+            items = json.loads(text)
+            if isinstance(items, list):
+                return [str(item).strip() if item is not None else "" for item in items]
+        except ValueError:
+            pass
+
+    # Names such as "Acme, Inc." contain commas, so only callers whose values never do may split on them.
+    separator = "," if comma_separated and "\n" not in text else "\n"
+    return [item.strip() for item in text.split(separator)]
+
+
+def parse_table_param(value: Any) -> list[dict]:
+    if value is None:
+        return []
+    if isinstance(value, list):
+        rows = value
+    else:
+        text = str(value).strip()
+        if not text:
+            return []
+        if text.startswith("["):
+            try:
+                rows = json.loads(text)
+            except ValueError as e:
+                raise Exception(f"Invalid JSON array: {e}")
+            if not isinstance(rows, list):
+                raise Exception("JSON input must be an array of objects.")
+        else:
+            rows = list(csv.DictReader(io.StringIO(text)))
+
+    table = []
+    for row in rows:
+        if not isinstance(row, dict):
+            raise Exception("Every row must be an object with named columns.")
+        table.append({str(key).strip(): "" if value is None else str(value).strip()
+                      for key, value in row.items() if key is not None})
+    return table
+
+
+def person_match_input(row: dict) -> dict:
+    match_input = {}
+    for key, value in row.items():
+        field = PERSON_INPUT_ALIASES.get(key.replace("_", "").replace(" ", "").lower())
+        if field and value:
+            match_input[field] = value
+    return match_input
+
+
+def dedup_key(match_input: dict) -> tuple:
+    return tuple(sorted((key, " ".join(str(value).split()).casefold()) for key, value in match_input.items()))
+
+
+def chunked(items: list, size: int = MAX_MATCH_INPUTS) -> list[list]:
+    return [items[i:i + size] for i in range(0, len(items), size)]
+
+
+def match_results(result_data: Any) -> list[dict]:
+    if not isinstance(result_data, dict):
+        return []
+    data = result_data.get("data")
+    if isinstance(data, dict):
+        results = data.get("result")
+        if isinstance(results, list):
+            return results
+    return []
+
+
+def _same_input(expected: dict, echoed: Any) -> bool:
+    if not isinstance(echoed, dict):
+        return False
+    for key, value in expected.items():
+        echoed_value = echoed.get(key)
+        if echoed_value is None or str(echoed_value).strip().casefold() != str(value).strip().casefold():
+            return False
+    return True
+
+
+def map_results_to_inputs(inputs: list[dict], results: list[dict]) -> list[Optional[dict]]:
+    # ZoomInfo answers in input order; fall back to matching the echoed input when counts differ.
+    if len(results) == len(inputs):
+        return list(results)
+
+    mapped: list[Optional[dict]] = [None] * len(inputs)
+    remaining = list(results)
+    for index, match_input in enumerate(inputs):
+        for candidate in remaining:
+            if _same_input(match_input, candidate.get("input")):
+                mapped[index] = candidate
+                remaining.remove(candidate)
+                break
+    return mapped
+
+
+def row_outcome(result: Optional[dict]) -> tuple[str, list, Optional[str]]:
+    if not result:
+        return "not_found", [], None
+
+    records = result.get("data") or []
+    if isinstance(records, dict):
+        records = [records]
+    match_status = result.get("matchStatus")
+
+    if records:
+        return "matched", records, None
+    if match_status and match_status not in NOT_FOUND_MATCH_STATUSES:
+        return "error", [], f"ZoomInfo match status: {match_status}"
+    return "not_found", [], None
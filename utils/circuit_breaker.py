@@ -0,0 +1,122 @@
+import os
+import time
+import threading
+from urllib.parse import urlparse
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+FAILURE_THRESHOLD = int(os.getenv("ZOOMINFO_BREAKER_FAILURES", "5"))
+RECOVERY_TIMEOUT = float(os.getenv("ZOOMINFO_BREAKER_RECOVERY", "30"))
+HALF_OPEN_MAX_PROBES = 1
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    def __init__(self, name: str, failure_threshold: int = FAILURE_THRESHOLD,
+                 recovery_timeout: float = RECOVERY_TIMEOUT, half_open_max_probes: int = HALF_OPEN_MAX_PROBES):
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_timeout = recovery_timeout
+        self.half_open_max_probes = half_open_max_probes
+        self._lock = threading.Lock()
+        self._state = CLOSED
+        self._consecutive_failures = 0
+        self._opened_at = 0.0
+        self._probes_in_flight = 0
+        self._probe_started = 0.0
+        self._times_opened = 0
+        self._short_circuited = 0
+
+    def _transition(self, state: str) -> None:
+        if state != self._state:
+            logger.warning(f"Circuit breaker for {self.name} moved from {self._state} to {state}")
+            self._state = state
+
+    def before_call(self) -> None:
+        with self._lock:
+            if self._state == OPEN:
+                retry_in = self._opened_at + self.recovery_timeout - time.monotonic()
+                if retry_in > 0:
+                    self._short_circuited += 1
+                    raise Exception(
+                        f"ZoomInfo API error: {self.name} is unavailable after {self._consecutive_failures} "
+                        f"consecutive failures; failing fast, next attempt in {retry_in:.0f} seconds")
+                self._transition(HALF_OPEN)
+                self._probes_in_flight = 0
+
+            if self._state == HALF_OPEN:
+                # A probe that never reported back does not hold the breaker half open forever.
+                probe_stale = time.monotonic() - self._probe_started > self.recovery_timeout
+                if self._probes_in_flight >= self.half_open_max_probes and not probe_stale:
+                    self._short_circuited += 1
+                    raise Exception(
+                        f"ZoomInfo API error: {self.name} is recovering from an outage; "
+                        f"a probe request is in flight, failing fast")
+                if probe_stale:
+                    self._probes_in_flight = 0
+                self._probes_in_flight += 1
+                self._probe_started = time.monotonic()
+
+    def release(self) -> None:
+        # Hands back a probe slot when the call was abandoned before any request was sent.
+        with self._lock:
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+
+    def record_success(self) -> None:
+        with self._lock:
+            self._consecutive_failures = 0
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                self._transition(CLOSED)
+
+    def record_failure(self) -> None:
+        with self._lock:
+            self._consecutive_failures += 1
+            if self._state == HALF_OPEN:
+                self._probes_in_flight = max(self._probes_in_flight - 1, 0)
+                self._open()
+            elif self._state == CLOSED and self._consecutive_failures >= self.failure_threshold:
+                self._open()
+
+    def _open(self) -> None:
+        self._opened_at = time.monotonic()
+        self._times_opened += 1
+        self._transition(OPEN)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            retry_in = 0.0
+            if self._state == OPEN:
+                retry_in = max(self._opened_at + self.recovery_timeout - time.monotonic(), 0.0)
+            return {
+                "state": self._state,
+                "consecutive_failures": self._consecutive_failures,
+                "retry_in_seconds": round(retry_in, 1),
+                "times_opened": self._times_opened,
+                "short_circuited": self._short_circuited,
+            }
+
+
+_breakers: dict[str, CircuitBreaker] = {}
+_breakers_lock = threading.Lock()
+
+
+def get_circuit_breaker(url: str) -> CircuitBreaker:
+    endpoint = urlparse(url).path or url
+    with _breakers_lock:
+        breaker = _breakers.get(endpoint)
+        if breaker is None:
+            breaker = CircuitBreaker(f"ZoomInfo {endpoint}")
+            _breakers[endpoint] = breaker
+        return breaker
+
+
+def circuit_breaker_states() -> dict:
+    with _breakers_lock:
+        breakers = dict(_breakers)
+    return {endpoint: breaker.snapshot() for endpoint, breaker in breakers.items()}
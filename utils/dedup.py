@@ -0,0 +1,57 @@
+import os
+import re
+import hashlib
+from collections import OrderedDict
+from typing import Any
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# 8-byte digests keep ~100k keys well under 20 MB even with dict overhead.
+MAX_DEDUP_KEYS = int(os.getenv("ZOOMINFO_DEDUP_MAX_KEYS", "100000"))
+
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def normalize_title(value: Any) -> str:
+    return _NON_WORD.sub(" ", str(value).casefold()).strip()
+
+
+def article_digests(item: Any) -> list[bytes]:
+    if not isinstance(item, dict):
+        return []
+    material = []
+    if item.get("id") is not None:
+        material.append(f"id:{item['id']}")
+    if item.get("url"):
+        material.append(f"url:{str(item['url']).strip().rstrip('/').casefold()}")
+    title = normalize_title(item.get("title") or "")
+    if title:
+        material.append(f"title:{title}")
+    return [hashlib.blake2b(value.encode("utf-8"), digest_size=8).digest() for value in material]
+
+
+class ArticleDeduper:
+    def __init__(self, max_keys: int = MAX_DEDUP_KEYS):
+        self.max_keys = max_keys
+        self.dropped = 0
+        self._seen: OrderedDict[bytes, None] = OrderedDict()
+
+    def unique(self, items: list) -> list:
+        kept = []
+        for item in items:
+            digests = article_digests(item)
+            if any(digest in self._seen for digest in digests):
+                self.dropped += 1
+                continue
+            for digest in digests:
+                self._seen[digest] = None
+            kept.append(item)
+
+        # Forget the oldest keys first; on very large pulls a late repeat of an early article may slip through.
+        while len(self._seen) > self.max_keys:
+            self._seen.popitem(last=False)
+
+        if len(kept) < len(items):
+            logger.info(f"Dropped {len(items) - len(kept)} duplicate articles")
+        return kept
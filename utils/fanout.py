@@ -0,0 +1,27 @@
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from typing import Any, Callable, Hashable
+from utils.metrics import propagate_context
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+MAX_FANOUT_WORKERS = 10
+
+
+def fan_out(keys: list[Hashable], fn: Callable[[Hashable], dict], max_workers: int) -> dict[Hashable, dict]:
+    workers = max(1, min(max_workers, MAX_FANOUT_WORKERS, len(keys)))
+    logger.info(f"Fanning out {len(keys)} requests over {workers} workers")
+
+    results: dict[Hashable, Any] = {}
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zoominfo-fanout") as executor:
+        futures = {executor.submit(propagate_context(fn), key): key for key in keys}
+        for future in as_completed(futures):
+            key = futures[future]
+            try:
+                results[key] = future.result()
+            except Exception as e:
+                logger.error(f"Fan-out request for {key} failed: {str(e)}")
+                results[key] = {"status": "error", "error": str(e)}
+
+    # Hand results back in input order regardless of completion order.
+    return {key: results[key] for key in keys}
@@ -0,0 +1,199 @@
+import os
+import re
+import json
+import time
+import zlib
+import difflib
+import threading
+from typing import Optional
+from utils.http_client import api_url
+from utils.retry_policy import send_with_retry, Deadline
+from utils.storage_budget import storage_budget
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Snapshot of /lookup/outputfields/{entity}/enrich; matches the lists in the tool descriptions.
+BUNDLED_OUTPUT_FIELDS = {
+    "company": (
+        "id", "name", "website", "ticker", "logo", "phone", "fax",
+        "street", "city", "state", "zipCode", "country", "continent", "metroArea",
+        "revenue", "employeeCount", "industries", "primaryIndustry", "companyStatus", "foundedYear", "type",
+        "businessModel",
+        "ultimateParentId", "ultimateParentName", "parentId", "parentName", "locationCount",
+        "descriptionList", "sicCodes", "naicsCodes", "competitors", "products", "hashtags",
+        "revenueRange", "employeeRange", "companyFunding", "recentFundingAmount", "totalFundingAmount",
+        "employeeGrowth", "departmentBudgets", "employeeCountByDepartment",
+        "socialMediaUrls", "numberOfContactsInZoomInfo", "domainList", "subUnitCodes", "certificationDate",
+        "certified", "isDefunct", "engagements",
+    ),
+    "contact": (
+        "id", "firstName", "middleName", "lastName", "salutation", "suffix", "picture",
+        "email", "hasCanadianEmail", "phone", "directPhoneDoNotCall", "mobilePhoneDoNotCall",
+        "street", "city", "region", "metroArea", "zipCode", "state", "country", "continent",
+        "jobTitle", "jobFunction", "managementLevel", "positionStartDate", "yearsOfExperience",
+        "companyId", "companyName", "companyDescriptionList", "companyPhone", "companyWebsite", "companyRevenue",
+        "companyEmployeeCount",
+        "education", "techSkills",
+        "withinEu", "withinCalifornia", "withinCanada", "personHasMoved", "noticeProvidedDate",
+        "hashedEmails", "externalUrls", "employmentHistory", "contactAccuracyScore", "engagements",
+    ),
+}
+
+# Keys are already folded by _fold: lower case, letters and digits only.
+FIELD_ALIASES = {
+    "company": {
+        "companyname": "name", "companyid": "id", "domain": "website", "url": "website", "zip": "zipCode",
+        "postalcode": "zipCode", "employees": "employeeCount", "headcount": "employeeCount",
+        "industry": "primaryIndustry", "description": "descriptionList", "founded": "foundedYear",
+        "parent": "parentName", "ultimateparent": "ultimateParentName", "domains": "domainList",
+    },
+    "contact": {
+        "first": "firstName", "last": "lastName", "middle": "middleName", "title": "jobTitle",
+        "emailaddress": "email", "company": "companyName", "employer": "companyName", "zip": "zipCode",
+        "postalcode": "zipCode", "function": "jobFunction", "level": "managementLevel",
+        "seniority": "managementLevel", "skills": "techSkills", "photo": "picture",
+    },
+}
+
+CATALOG_REFRESH_ENABLED = os.getenv("ZOOMINFO_FIELD_CATALOG_REFRESH", "false").lower() == "true"
+CATALOG_REFRESH_INTERVAL = float(os.getenv("ZOOMINFO_FIELD_CATALOG_TTL", str(7 * 24 * 60 * 60)))
+# Each entity persists its own diff, so the catalog share of the storage quota is split between them.
+CATALOG_STORAGE_BUDGET = storage_budget("field_catalog", parts=len(BUNDLED_OUTPUT_FIELDS))
+CATALOG_REQUEST_TIMEOUT = 10
+
+_NON_ALNUM = re.compile(r"[^0-9a-z]+")
+
+_catalogs: dict[str, "OutputFieldCatalog"] = {}
+_catalogs_lock = threading.Lock()
+
+
+def _fold(field: str) -> str:
+    return _NON_ALNUM.sub("", field.lower())
+
+
+class OutputFieldCatalog:
+    def __init__(self, entity: str, fields: tuple, refreshed_at: float = 0.0):
+        self.entity = entity
+        self.fields = tuple(fields)
+        self.refreshed_at = refreshed_at
+        self._by_fold = self._index(self.fields)
+        self._refresh_lock = threading.Lock()
+
+    def _index(self, fields: tuple) -> dict[str, str]:
+        by_fold = {_fold(field): field for field in fields}
+        for alias, field in FIELD_ALIASES.get(self.entity, {}).items():
+            if field in fields:
+                by_fold.setdefault(alias, field)
+        return by_fold
+
+    def resolve(self, field: str) -> Optional[str]:
+        return self._by_fold.get(_fold(field))
+
+    def suggest(self, field: str) -> Optional[str]:
+        matches = difflib.get_close_matches(_fold(field), list(self._by_fold), n=1, cutoff=0.75)
+        return self._by_fold[matches[0]] if matches else None
+
+    def normalize(self, output_fields: list[str], session_manager=None, storage=None) -> list[str]:
+        unknown = [field for field in output_fields if self.resolve(field) is None]
+        if unknown and session_manager is not None and self.refresh(session_manager, storage):
+            unknown = [field for field in output_fields if self.resolve(field) is None]
+
+        if unknown:
+            problems = []
+            for field in unknown:
+                suggestion = self.suggest(field)
+                problems.append(f"'{field}' (did you mean '{suggestion}'?)" if suggestion else f"'{field}'")
+            logger.warning(f"Rejected unknown {self.entity} output fields: {unknown}")
+            raise Exception(f"Invalid request: unknown {self.entity} output fields {', '.join(problems)}.")
+
+        return list(dict.fromkeys(self.resolve(field) for field in output_fields))
+
+    def refresh(self, session_manager, storage=None) -> bool:
+        if not CATALOG_REFRESH_ENABLED or time.time() - self.refreshed_at < CATALOG_REFRESH_INTERVAL:
+            return False
+
+        # One refresh at a time; callers that lose the race keep the current list.
+        if not self._refresh_lock.acquire(blocking=False):
+            return False
+        try:
+            fields = self._fetch_fields(session_manager)
+            self.refreshed_at = time.time()
+            if not fields:
+                return False
+            # Rebuilt rather than updated, so fields ZoomInfo has dropped stop resolving.
+            self.fields = tuple(fields)
+            self._by_fold = self._index(self.fields)
+            if storage is not None:
+                self._persist(storage)
+            logger.info(f"Refreshed {self.entity} output field catalog with {len(fields)} fields")
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to refresh {self.entity} output field catalog: {e}")
+            self.refreshed_at = time.time()
+            return False
+        finally:
+            self._refresh_lock.release()
+
+    def _fetch_fields(self, session_manager) -> list[str]:
+        # Same path as the enrich calls: circuit breaker, rate limiter, re-authentication and retries.
+        response = send_with_retry(session_manager, api_url(f"lookup/outputfields/{self.entity}/enrich"), None,
+                                   deadline=Deadline(CATALOG_REQUEST_TIMEOUT), method="GET")
+        if response.status_code != 200:
+            raise Exception(f"ZoomInfo API error (status {response.status_code}): {response.text[:200]}")
+
+        entries = response.json()
+        if isinstance(entries, dict):
+            entries = entries.get("data") or entries.get("result") or []
+        fields = []
+        for entry in entries:
+            name = (entry.get("fieldName") or entry.get("name")) if isinstance(entry, dict) else entry
+            if isinstance(name, str) and name:
+                fields.append(name)
+        return fields
+
+    def _persist(self, storage) -> None:
+        # Only the difference from the bundled snapshot is stored, to stay inside the storage quota.
+        bundled = set(BUNDLED_OUTPUT_FIELDS.get(self.entity, ()))
+        current = set(self.fields)
+        snapshot = {
+            "at": int(self.refreshed_at),
+            "added": sorted(current - bundled),
+            "removed": sorted(bundled - current),
+        }
+        encoded = zlib.compress(json.dumps(snapshot, separators=(",", ":")).encode("utf-8"))
+        if len(encoded) > CATALOG_STORAGE_BUDGET:
+            logger.info(f"Refreshed {self.entity} field catalog is too large to persist ({len(encoded)} bytes)")
+            return
+        try:
+            storage.set(f"zoominfo_fields_{self.entity}", encoded)
+        except Exception as e:
+            logger.warning(f"Failed to store {self.entity} field catalog: {e}")
+
+
+def _load_persisted(entity: str, storage) -> Optional[OutputFieldCatalog]:
+    try:
+        raw = storage.get(f"zoominfo_fields_{entity}")
+        if not raw:
+            return None
+        snapshot = json.loads(zlib.decompress(raw))
+    except Exception as e:
+        logger.warning(f"Unable to read stored {entity} field catalog: {e}")
+        return None
+
+    removed = set(snapshot.get("removed", []))
+    fields = [field for field in BUNDLED_OUTPUT_FIELDS.get(entity, ()) if field not in removed]
+    fields.extend(snapshot.get("added", []))
+    return OutputFieldCatalog(entity, tuple(fields), float(snapshot.get("at", 0)))
+
+
+def get_field_catalog(entity: str, storage=None) -> OutputFieldCatalog:
+    with _catalogs_lock:
+        catalog = _catalogs.get(entity)
+        if catalog is None:
+            if CATALOG_REFRESH_ENABLED and storage is not None:
+                catalog = _load_persisted(entity, storage)
+            if catalog is None:
+                catalog = OutputFieldCatalog(entity, BUNDLED_OUTPUT_FIELDS.get(entity, ()))
+            _catalogs[entity] = catalog
+        return catalog
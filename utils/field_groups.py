@@ -0,0 +1,98 @@
+import copy
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable
+from utils.batch import match_results
+from utils.metrics import propagate_context
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+MAX_FIELDS_PER_REQUEST = 5
+MAX_FIELD_GROUP_WORKERS = 4
+MERGE_KEY_FIELD = "id"
+
+
+def split_fields(output_fields: list[str], group_size: int = MAX_FIELDS_PER_REQUEST) -> list[list[str]]:
+    fields = list(dict.fromkeys(output_fields))
+    if len(fields) <= group_size:
+        return [fields]
+
+    # Every group also asks for the record ID so the partial records can be stitched back together.
+    others = [field for field in fields if field.lower() != MERGE_KEY_FIELD]
+    step = group_size - 1
+    return [[MERGE_KEY_FIELD] + others[start:start + step] for start in range(0, len(others), step)]
+
+
+def _record_key(record: Any, index: int) -> Any:
+    if isinstance(record, dict) and record.get(MERGE_KEY_FIELD) is not None:
+        return record[MERGE_KEY_FIELD]
+    return ("position", index)
+
+
+def _merge_match(target: dict, source: dict) -> None:
+    target_records = target.get("data")
+    source_records = source.get("data")
+    if not isinstance(source_records, list):
+        return
+    if not isinstance(target_records, list):
+        target["data"] = copy.deepcopy(source_records)
+        return
+
+    by_key = {_record_key(record, index): record for index, record in enumerate(target_records)}
+    for index, record in enumerate(source_records):
+        existing = by_key.get(_record_key(record, index))
+        if isinstance(existing, dict) and isinstance(record, dict):
+            existing.update(record)
+        else:
+            target_records.append(copy.deepcopy(record))
+
+
+def merge_group_results(results: list[Any]) -> Any:
+    merged = copy.deepcopy(results[0])
+    merged_matches = match_results(merged)
+    output_fields = []
+
+    for result_data in results:
+        data = result_data.get("data") if isinstance(result_data, dict) else None
+        if isinstance(data, dict) and isinstance(data.get("outputFields"), list):
+            output_fields.extend(data["outputFields"])
+
+    for result_data in results[1:]:
+        for index, match in enumerate(match_results(result_data)):
+            if index < len(merged_matches):
+                _merge_match(merged_matches[index], match)
+            else:
+                merged_matches.append(copy.deepcopy(match))
+
+    if output_fields and isinstance(merged.get("data"), dict):
+        merged["data"]["outputFields"] = list(dict.fromkeys(output_fields))
+    return merged
+
+
+def fetch_field_groups(groups: list[list[str]], fetch_group: Callable[[list[str]], Any],
+                       max_workers: int = MAX_FIELD_GROUP_WORKERS) -> tuple[Any, list[dict]]:
+    if len(groups) == 1:
+        return fetch_group(groups[0]), [{"fields": groups[0], "status": "success"}]
+
+    workers = max(1, min(max_workers, len(groups)))
+    logger.info(f"Splitting {sum(len(group) for group in groups)} output fields into {len(groups)} "
+                f"requests over {workers} workers")
+
+    with ThreadPoolExecutor(max_workers=workers, thread_name_prefix="zoominfo-fields") as executor:
+        futures = [executor.submit(propagate_context(fetch_group), group) for group in groups]
+
+    group_status = []
+    succeeded = []
+    errors = []
+    for group, future in zip(groups, futures):
+        try:
+            succeeded.append(future.result())
+            group_status.append({"fields": group, "status": "success"})
+        except Exception as e:
+            logger.warning(f"Field group {group} failed: {str(e)}")
+            errors.append(e)
+            group_status.append({"fields": group, "status": "error", "error": str(e)})
+
+    if not succeeded:
+        raise errors[0]
+    return merge_group_results(succeeded), group_status
@@ -0,0 +1,157 @@
+import os
+import socket
+import threading
+from typing import Optional
+from urllib.parse import urlparse
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.connectionpool import HTTPConnectionPool, HTTPSConnectionPool
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+ZOOMINFO_API_BASE = os.getenv("ZOOMINFO_API_BASE", "https://api.zoominfo.com").rstrip("/")
+
+DEFAULT_POOL_CONNECTIONS = int(os.getenv("ZOOMINFO_POOL_CONNECTIONS", "4"))
+DEFAULT_POOL_MAXSIZE = int(os.getenv("ZOOMINFO_POOL_MAXSIZE", "16"))
+DEFAULT_PER_HOST_LIMIT = int(os.getenv("ZOOMINFO_PER_HOST_LIMIT", "16"))
+
+
+def api_url(path: str) -> str:
+    return f"{ZOOMINFO_API_BASE}/{path.lstrip('/')}"
+
+
+class _PoolStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.new_connections = 0
+
+    def record_checkout(self) -> None:
+        with self._lock:
+            self.checkouts += 1
+
+    def record_new_connection(self) -> None:
+        with self._lock:
+            self.new_connections += 1
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            checkouts = self.checkouts
+            misses = self.new_connections
+        return {
+            "requests": checkouts,
+            "pool_hits": max(checkouts - misses, 0),
+            "pool_misses": misses,
+        }
+
+
+_pool_stats = _PoolStats()
+
+
+# urllib3 creates a new connection inside _get_conn only when the pool has no idle
+# keep-alive connection to hand out, so every checkout is a hit unless _new_conn ran.
+class _CountingHTTPConnectionPool(HTTPConnectionPool):
+    def _get_conn(self, timeout=None):
+        _pool_stats.record_checkout()
+        return super()._get_conn(timeout)
+
+    def _new_conn(self):
+        _pool_stats.record_new_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPSConnectionPool(HTTPSConnectionPool):
+    def _get_conn(self, timeout=None):
+        _pool_stats.record_checkout()
+        return super()._get_conn(timeout)
+
+    def _new_conn(self):
+        _pool_stats.record_new_connection()
+        return super()._new_conn()
+
+
+class _CountingHTTPAdapter(HTTPAdapter):
+    def init_poolmanager(self, *args, **kwargs):
+        super().init_poolmanager(*args, **kwargs)
+        self.poolmanager.pool_classes_by_scheme = {
+            "http": _CountingHTTPConnectionPool,
+            "https": _CountingHTTPSConnectionPool,
+        }
+
+
+class ZoomInfoHttpClient:
+    def __init__(self, pool_connections: int = DEFAULT_POOL_CONNECTIONS, pool_maxsize: int = DEFAULT_POOL_MAXSIZE,
+                 per_host_limit: int = DEFAULT_PER_HOST_LIMIT):
+        self.pool_connections = pool_connections
+        self.pool_maxsize = pool_maxsize
+        self.per_host_limit = per_host_limit
+
+        adapter = _CountingHTTPAdapter(pool_connections=pool_connections, pool_maxsize=pool_maxsize)
+        self._session = requests.Session()
+        self._session.mount("https://", adapter)
+        self._session.mount("http://", adapter)
+
+        self._host_limits: dict[str, threading.BoundedSemaphore] = {}
+        self._host_limits_lock = threading.Lock()
+
+        logger.info(f"Initialized pooled ZoomInfo HTTP client (pool_connections={pool_connections}, "
+                    f"pool_maxsize={pool_maxsize}, per_host_limit={per_host_limit})")
+
+    def _host_limit(self, url: str) -> threading.BoundedSemaphore:
+        host = urlparse(url).netloc
+        with self._host_limits_lock:
+            semaphore = self._host_limits.get(host)
+            if semaphore is None:
+                semaphore = threading.BoundedSemaphore(self.per_host_limit)
+                self._host_limits[host] = semaphore
+            return semaphore
+
+    def request(self, method: str, url: str, **kwargs) -> requests.Response:
+        with self._host_limit(url):
+            return self._session.request(method, url, **kwargs)
+
+    def post(self, url: str, **kwargs) -> requests.Response:
+        return self.request("POST", url, **kwargs)
+
+    def get(self, url: str, **kwargs) -> requests.Response:
+        return self.request("GET", url, **kwargs)
+
+    def warm_up(self, base_url: str = ZOOMINFO_API_BASE, timeout: float = 5) -> bool:
+        parsed = urlparse(base_url)
+        host = parsed.hostname
+        port = parsed.port or (443 if parsed.scheme == "https" else 80)
+
+        try:
+            logger.info(f"Warming up DNS and connection pool for {host}")
+            socket.getaddrinfo(host, port, type=socket.SOCK_STREAM)
+            # Any response means the TCP+TLS handshake is done and the connection sits in the pool.
+            self.request("HEAD", base_url, timeout=timeout, allow_redirects=False)
+            logger.info(f"Connection pool warmed up for {host}")
+            return True
+        except (OSError, requests.exceptions.RequestException) as e:
+            logger.warning(f"Failed to warm up connection pool for {host}: {e}")
+            return False
+
+    def pool_stats(self) -> dict:
+        stats = _pool_stats.snapshot()
+        stats["pool_maxsize"] = self.pool_maxsize
+        stats["per_host_limit"] = self.per_host_limit
+        return stats
+
+    def close(self) -> None:
+        self._session.close()
+
+
+_client: Optional[ZoomInfoHttpClient] = None
+_client_lock = threading.Lock()
+
+
+def get_http_client() -> ZoomInfoHttpClient:
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ZoomInfoHttpClient()
+    return _client
@@ -0,0 +1,26 @@
+import logging
+import threading
+from dify_plugin.config.logger_format import plugin_logger_handler
+
+# The handler and level are set once on each package logger; module loggers propagate to them.
+PACKAGE_LOGGERS = ("provider", "tools", "utils")
+
+_configured: set[str] = set()
+_configured_lock = threading.Lock()
+
+
+def _configure(name: str) -> None:
+    with _configured_lock:
+        if name in _configured:
+            return
+        package_logger = logging.getLogger(name)
+        package_logger.setLevel(logging.INFO)
+        package_logger.addHandler(plugin_logger_handler)
+        _configured.add(name)
+
+
+def get_logger(name: str) -> logging.Logger:
+    package = name.split(".", 1)[0]
+    # Modules loaded under an unexpected name still get the plugin handler, just on their own logger.
+    _configure(package if package in PACKAGE_LOGGERS else name)
+    return logging.getLogger(name)
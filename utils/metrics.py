@@ -0,0 +1,263 @@
+import os
+import time
+import threading
+import functools
+import contextvars
+from contextlib import contextmanager
+from collections.abc import Generator, Iterator
+from typing import Any, Callable, Optional
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+LATENCY_BUCKETS_MS = (5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000, 60000)
+SIZE_BUCKETS_BYTES = (256, 1024, 4096, 16384, 65536, 262144, 1048576, 4194304)
+
+METRICS_EXPORTER = os.getenv("ZOOMINFO_METRICS_EXPORTER", "memory").lower()
+METRICS_TEXTFILE = os.getenv("ZOOMINFO_METRICS_TEXTFILE", "")
+
+
+class Histogram:
+    def __init__(self, buckets: tuple):
+        self.buckets = buckets
+        self.counts = [0] * (len(buckets) + 1)
+        self.count = 0
+        self.sum = 0.0
+
+    def observe(self, value: float) -> None:
+        for index, bound in enumerate(self.buckets):
+            if value <= bound:
+                self.counts[index] += 1
+                break
+        else:
+            self.counts[-1] += 1
+        self.count += 1
+        self.sum += value
+
+    def snapshot(self) -> dict:
+        return {"count": self.count, "sum": round(self.sum, 3), "buckets": dict(zip(
+            [str(bound) for bound in self.buckets] + ["+Inf"], self.counts))}
+
+
+def _label_key(labels: dict) -> tuple:
+    return tuple(sorted((key, str(value)) for key, value in labels.items()))
+
+
+class MetricsRegistry:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counters: dict[tuple[str, tuple], float] = {}
+        self._histograms: dict[tuple[str, tuple], Histogram] = {}
+
+    def inc(self, name: str, value: float = 1, **labels) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            self._counters[key] = self._counters.get(key, 0) + value
+
+    def observe(self, name: str, value: float, buckets: tuple = LATENCY_BUCKETS_MS, **labels) -> None:
+        key = (name, _label_key(labels))
+        with self._lock:
+            histogram = self._histograms.get(key)
+            if histogram is None:
+                histogram = Histogram(buckets)
+                self._histograms[key] = histogram
+            histogram.observe(value)
+
+    def snapshot(self) -> dict:
+        with self._lock:
+            return {
+                "counters": [{"name": name, "labels": dict(labels), "value": value}
+                             for (name, labels), value in self._counters.items()],
+                "histograms": [{"name": name, "labels": dict(labels), **histogram.snapshot()}
+                               for (name, labels), histogram in self._histograms.items()],
+            }
+
+    def reset(self) -> None:
+        with self._lock:
+            self._counters.clear()
+            self._histograms.clear()
+
+
+def _escape_label(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n")
+
+
+def _prometheus_labels(labels: dict, extra: Optional[dict] = None) -> str:
+    merged = {**labels, **(extra or {})}
+    if not merged:
+        return ""
+    return "{" + ",".join(f'{key}="{_escape_label(value)}"' for key, value in merged.items()) + "}"
+
+
+def render_prometheus(snapshot: dict) -> str:
+    lines = []
+    typed = set()
+    for counter in snapshot["counters"]:
+        if counter["name"] not in typed:
+            lines.append(f"# TYPE {counter['name']} counter")
+            typed.add(counter["name"])
+        lines.append(f"{counter['name']}{_prometheus_labels(counter['labels'])} {counter['value']}")
+    for histogram in snapshot["histograms"]:
+        name = histogram["name"]
+        if name not in typed:
+            lines.append(f"# TYPE {name} histogram")
+            typed.add(name)
+        cumulative = 0
+        for bound, count in histogram["buckets"].items():
+            cumulative += count
+            lines.append(f"{name}_bucket{_prometheus_labels(histogram['labels'], {'le': bound})} {cumulative}")
+        lines.append(f"{name}_sum{_prometheus_labels(histogram['labels'])} {histogram['sum']}")
+        lines.append(f"{name}_count{_prometheus_labels(histogram['labels'])} {histogram['count']}")
+    return "\n".join(lines) + "\n"
+
+
+class InMemoryExporter:
+    def __init__(self):
+        self.last_invocation: Optional[dict] = None
+
+    def export(self, registry: MetricsRegistry, invocation: dict) -> None:
+        self.last_invocation = invocation
+
+
+class LogExporter:
+    def export(self, registry: MetricsRegistry, invocation: dict) -> None:
+        phases = " ".join(f"{name}={value}ms" for name, value in invocation["phases"].items())
+        logger.info(f"metrics tool={invocation['tool']} status={invocation['status']} "
+                    f"total={invocation['total_ms']}ms {phases}")
+
+
+class PrometheusExporter:
+    def __init__(self, path: str = METRICS_TEXTFILE):
+        self.path = path
+
+    def export(self, registry: MetricsRegistry, invocation: dict) -> None:
+        if not self.path:
+            return
+        # Written via rename so a node_exporter textfile collector never reads a half-written file.
+        temp_path = f"{self.path}.{os.getpid()}.tmp"
+        try:
+            with open(temp_path, "w", encoding="utf-8") as metrics_file:
+                metrics_file.write(render_prometheus(registry.snapshot()))
+            os.replace(temp_path, self.path)
+        except OSError as e:
+            logger.warning(f"Failed to write metrics to {self.path}: {e}")
+
+
+_EXPORTERS = {"memory": InMemoryExporter, "log": LogExporter, "prometheus": PrometheusExporter}
+
+registry = MetricsRegistry()
+_exporter = _EXPORTERS.get(METRICS_EXPORTER, InMemoryExporter)()
+
+
+def set_exporter(exporter: Any) -> None:
+    global _exporter
+    _exporter = exporter
+
+
+def get_exporter() -> Any:
+    return _exporter
+
+
+def metrics_snapshot() -> dict:
+    from utils.http_client import get_http_client
+
+    # Connection setup is not timed separately; pool misses show how often a new connection was opened.
+    return {**registry.snapshot(), "connection_pool": get_http_client().pool_stats()}
+
+
+class InvocationTimer:
+    def __init__(self, tool: str):
+        self.tool = tool
+        self.started = time.perf_counter()
+        self._lock = threading.Lock()
+        self.phases: dict[str, float] = {}
+
+    def add(self, phase: str, elapsed_ms: float) -> None:
+        with self._lock:
+            self.phases[phase] = self.phases.get(phase, 0.0) + elapsed_ms
+
+    def timings(self) -> dict:
+        with self._lock:
+            phases = {name: round(value, 1) for name, value in self.phases.items()}
+        return {"total_ms": round((time.perf_counter() - self.started) * 1000, 1), "phases": phases}
+
+
+_current_timer: contextvars.ContextVar[Optional[InvocationTimer]] = contextvars.ContextVar(
+    "zoominfo_invocation_timer", default=None)
+
+
+def current_tool() -> str:
+    timer = _current_timer.get()
+    return timer.tool if timer is not None else "none"
+
+
+def record_phase(phase: str, elapsed_ms: float, **labels) -> None:
+    timer = _current_timer.get()
+    if timer is not None:
+        timer.add(phase, elapsed_ms)
+    registry.observe("zoominfo_phase_duration_ms", elapsed_ms, phase=phase, tool=current_tool(), **labels)
+
+
+@contextmanager
+def timed_phase(phase: str, **labels) -> Iterator[None]:
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        record_phase(phase, (time.perf_counter() - started) * 1000, **labels)
+
+
+def current_timings() -> Optional[dict]:
+    timer = _current_timer.get()
+    return timer.timings() if timer is not None else None
+
+
+def propagate_context(fn: Callable) -> Callable:
+    # Worker threads start with an empty context; carry the invocation timer over to them.
+    context = contextvars.copy_context()
+
+    @functools.wraps(fn)
+    def wrapper(*args, **kwargs):
+        return context.copy().run(fn, *args, **kwargs)
+    return wrapper
+
+
+def instrumented(tool: str) -> Callable:
+    def decorator(invoke: Callable) -> Callable:
+        @functools.wraps(invoke)
+        def wrapper(self, tool_parameters: dict) -> Generator:
+            timer = InvocationTimer(tool)
+            # Every step of the tool runs inside the invocation's own context, so the timer is never left set in
+            # the caller's context between yields, whichever context the caller resumes from.
+            context = contextvars.copy_context()
+            context.run(_current_timer.set, timer)
+            generator = invoke(self, tool_parameters)
+            step, argument = generator.send, None
+            status = "error"
+            try:
+                while True:
+                    try:
+                        message = context.run(step, argument)
+                    except StopIteration:
+                        status = "success"
+                        return
+                    try:
+                        argument = yield message
+                        step = generator.send
+                    except GeneratorExit:
+                        # The caller stopped reading; that is not a failure of the tool.
+                        status = "cancelled"
+                        context.run(generator.close)
+                        raise
+                    except BaseException as e:
+                        step, argument = generator.throw, e
+            finally:
+                invocation = {"tool": tool, "status": status, **timer.timings()}
+                registry.inc("zoominfo_tool_invocations_total", tool=tool, status=status)
+                registry.observe("zoominfo_tool_duration_ms", invocation["total_ms"], tool=tool, status=status)
+                try:
+                    _exporter.export(registry, invocation)
+                except Exception as e:
+                    logger.warning(f"Metrics exporter failed: {e}")
+        return wrapper
+    return decorator
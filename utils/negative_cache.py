@@ -0,0 +1,38 @@
+import os
+from typing import Optional
+from utils.lru_cache import LruTtlCache
+from utils.result_cache import make_cache_key
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+NEGATIVE_CACHE_TTLS = {
+    "not_found": float(os.getenv("ZOOMINFO_NOT_FOUND_CACHE_TTL", "600")),
+    "invalid_input": float(os.getenv("ZOOMINFO_INVALID_INPUT_CACHE_TTL", "300")),
+}
+NEGATIVE_CACHE_ENTRIES = int(os.getenv("ZOOMINFO_NEGATIVE_CACHE_ENTRIES", "1024"))
+
+_negative_cache = LruTtlCache(NEGATIVE_CACHE_ENTRIES)
+
+
+def negative_cache_key(endpoint: str, match_input: dict, username: str) -> str:
+    # A company or contact that is not found stays not found whatever fields are asked for, so the key leaves them out.
+    return make_cache_key(endpoint, match_input, [], username)
+
+
+def lookup_negative(cache_key: str) -> Optional[tuple[str, str]]:
+    entry = _negative_cache.get(cache_key)
+    if entry is not None:
+        logger.info(f"Negative cache hit ({entry[0]}), answering without calling ZoomInfo")
+    return entry
+
+
+def record_negative(cache_key: str, error_kind: str, message: str) -> None:
+    ttl = NEGATIVE_CACHE_TTLS.get(error_kind)
+    if not ttl:
+        return
+    _negative_cache.set(cache_key, (error_kind, message), ttl)
+
+
+def negative_cache_stats() -> dict:
+    return _negative_cache.stats()
@@ -0,0 +1,87 @@
+import json
+from typing import Any, Optional
+from utils.batch import match_results
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+OUTPUT_MODES = ("full", "compact")
+TRUNCATION_MARK = "…"
+
+
+def _is_empty(value: Any) -> bool:
+    return value is None or value == "" or value == [] or value == {}
+
+
+def prune(value: Any, max_text_length: int = 0) -> Any:
+    # Builds new containers throughout; coalesced and cached responses are shared and must stay intact.
+    if isinstance(value, dict):
+        pruned = {}
+        for key, item in value.items():
+            item = prune(item, max_text_length)
+            if not _is_empty(item):
+                pruned[key] = item
+        return pruned
+    if isinstance(value, list):
+        return [item for item in (prune(item, max_text_length) for item in value) if not _is_empty(item)]
+    if isinstance(value, str) and max_text_length and len(value) > max_text_length:
+        return value[:max_text_length].rstrip() + TRUNCATION_MARK
+    return value
+
+
+def project_match_results(result_data: Any, output_fields: list[str]) -> Any:
+    matches = match_results(result_data)
+    if not matches:
+        return result_data
+
+    keep = set(output_fields)
+    return {
+        "result": [
+            {
+                "matchStatus": match.get("matchStatus"),
+                "data": [
+                    {key: value for key, value in record.items() if key in keep} if isinstance(record, dict)
+                    else record
+                    for record in (match.get("data") or [])
+                ]
+            }
+            for match in matches
+        ]
+    }
+
+
+def output_size(value: Any) -> int:
+    return len(json.dumps(value, separators=(",", ":"), ensure_ascii=False, default=str).encode("utf-8"))
+
+
+def parse_output_options(output_mode: Any, max_text_length: Any) -> tuple[str, int]:
+    output_mode = (output_mode or "full").strip().lower()
+    if output_mode not in OUTPUT_MODES:
+        logger.error(f"Invalid output mode: {output_mode}")
+        raise Exception(f"Output mode must be one of: {', '.join(OUTPUT_MODES)}.")
+
+    try:
+        max_text_length = int(max_text_length or 0)
+        if max_text_length < 0:
+            raise ValueError("Max text length must not be negative")
+    except (ValueError, TypeError):
+        logger.error(f"Invalid max text length: {max_text_length}")
+        raise Exception("Max text length must be zero or a positive integer.")
+    return output_mode, max_text_length
+
+
+def apply_output_mode(formatted_result: dict, output_mode: str, max_text_length: int = 0,
+                      output_fields: Optional[list[str]] = None) -> dict:
+    if output_mode != "compact":
+        return formatted_result
+
+    before = output_size(formatted_result)
+    result = dict(formatted_result)
+    if output_fields and "data" in result:
+        result["data"] = project_match_results(result["data"], output_fields)
+    result = prune(result, max_text_length)
+
+    after = output_size(result)
+    logger.info(f"Compact output reduced the JSON message from {before} to {after} bytes")
+    result["output_size"] = {"before": before, "after": after}
+    return result
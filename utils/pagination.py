@@ -0,0 +1,75 @@
+import math
+from collections.abc import Iterator
+from concurrent.futures import ThreadPoolExecutor, Future
+from typing import Any, Callable, Optional
+from utils.metrics import propagate_context
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+DEFAULT_PREFETCH_PAGES = 2
+MAX_PAGES = 100
+
+
+def page_items(result_data: Any) -> list:
+    if isinstance(result_data, dict):
+        items = result_data.get("data")
+        if isinstance(items, list):
+            return items
+    return []
+
+
+def total_results(result_data: Any) -> Optional[int]:
+    if isinstance(result_data, dict):
+        for key in ("totalResults", "total", "maxResults"):
+            value = result_data.get(key)
+            if isinstance(value, int):
+                return value
+    return None
+
+
+def iter_pages(fetch_page: Callable[[int], Any], start_page: int, page_size: int, max_items: int,
+               prefetch: int = DEFAULT_PREFETCH_PAGES) -> Iterator[tuple[int, Any, list]]:
+    last_page: Optional[int] = None
+    pending: dict[int, Future] = {}
+    next_to_submit = start_page
+    page = start_page
+    delivered = 0
+
+    fetch_page = propagate_context(fetch_page)
+    executor = ThreadPoolExecutor(max_workers=prefetch + 1, thread_name_prefix="zoominfo-page")
+    try:
+        while True:
+            # Keep the current page plus the next `prefetch` pages in flight.
+            while (next_to_submit <= page + prefetch and next_to_submit < start_page + MAX_PAGES
+                   and (last_page is None or next_to_submit <= last_page)):
+                pending[next_to_submit] = executor.submit(fetch_page, next_to_submit)
+                next_to_submit += 1
+
+            future = pending.pop(page, None)
+            if future is None:
+                break
+
+            result_data = future.result()
+            items = page_items(result_data)
+
+            total = total_results(result_data)
+            if total is not None and last_page is None:
+                last_page = max(math.ceil(total / page_size), start_page)
+                for stale_page in [p for p in pending if p > last_page]:
+                    pending.pop(stale_page).cancel()
+
+            items = items[:max_items - delivered]
+            delivered += len(items)
+            yield page, result_data, items
+
+            if (len(items) < page_size or delivered >= max_items
+                    or (last_page is not None and page >= last_page)):
+                break
+            page += 1
+    finally:
+        for future in pending.values():
+            future.cancel()
+        executor.shutdown(wait=False)
+
+    logger.info(f"Pagination finished after page {page} with {delivered} items")
@@ -0,0 +1,29 @@
+import os
+import time
+import threading
+from utils.http_client import get_http_client
+from utils.async_client import async_transport_enabled, load_httpx
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+PREWARM_ENABLED = os.getenv("ZOOMINFO_PREWARM", "false").lower() in ("1", "true", "yes")
+
+
+def prewarm() -> dict:
+    started = time.perf_counter()
+    # DNS, TCP and TLS for the pooled connection; tokens need per-install credentials, so they warm on first use.
+    warmed = {"connection_pool": get_http_client().warm_up()}
+    if async_transport_enabled():
+        load_httpx()
+        warmed["httpx"] = True
+    warmed["elapsed_ms"] = round((time.perf_counter() - started) * 1000, 1)
+    logger.info(f"Startup prewarm finished: {warmed}")
+    return warmed
+
+
+def prewarm_in_background() -> threading.Thread:
+    # Runs beside plugin.run() so the worker starts accepting invocations immediately.
+    thread = threading.Thread(target=prewarm, name="zoominfo-prewarm", daemon=True)
+    thread.start()
+    return thread
@@ -0,0 +1,157 @@
+import os
+import time
+import asyncio
+import threading
+from typing import Any, Optional
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# ZoomInfo's default account limit is 1500 requests per minute.
+DEFAULT_RATE = float(os.getenv("ZOOMINFO_RATE_LIMIT", "25"))
+DEFAULT_BURST = float(os.getenv("ZOOMINFO_RATE_BURST", "25"))
+MIN_RATE = 0.5
+RATE_DECREASE_FACTOR = 0.5
+RATE_INCREASE_STEP = 0.25
+
+RATE_LIMIT_REMAINING_HEADER = "X-RateLimit-Remaining"
+RATE_LIMIT_RESET_HEADER = "X-RateLimit-Reset"
+
+
+def _header_number(headers: Any, name: str) -> Optional[float]:
+    try:
+        value = headers.get(name)
+        return float(value) if value not in (None, "") else None
+    except (AttributeError, TypeError, ValueError):
+        return None
+
+
+class AdaptiveRateLimiter:
+    def __init__(self, rate: float = DEFAULT_RATE, burst: float = DEFAULT_BURST, min_rate: float = MIN_RATE):
+        self.max_rate = rate
+        self.rate = rate
+        self.burst = burst
+        self.min_rate = min_rate
+        self._tokens = burst
+        self._updated = time.monotonic()
+        self._blocked_until = 0.0
+        self._condition = threading.Condition()
+        self._acquired = 0
+        self._throttled = 0
+        self._rate_limited = 0
+        self._waited = 0.0
+
+    def _refill(self, now: float) -> None:
+        if now < self._blocked_until:
+            # Nothing accrues while ZoomInfo has told us to back off.
+            self._updated = now
+            return
+        self._tokens = min(self.burst, self._tokens + (now - self._updated) * self.rate)
+        self._updated = now
+
+    def _try_take(self, now: float, started: float, give_up_at: float, timeout: float) -> float:
+        # Returns 0 once a token is taken, otherwise how long to wait before trying again. Caller holds the lock.
+        self._refill(now)
+        wait = max(self._blocked_until - now, 0.0)
+        if wait == 0 and self._tokens >= 1:
+            self._tokens -= 1
+            self._acquired += 1
+            waited = now - started
+            if waited > 0.001:
+                self._throttled += 1
+                self._waited += waited
+            return 0.0
+
+        if wait == 0:
+            wait = (1 - self._tokens) / self.rate
+        if now + wait > give_up_at:
+            logger.warning(f"Rate limiter queue wait of {wait:.2f}s exceeds the remaining request budget")
+            raise Exception(
+                f"ZoomInfo API error: client rate limit of {self.rate:.1f} requests/second reached and "
+                f"no slot freed up within {timeout:.1f} seconds")
+        return wait
+
+    def acquire(self, timeout: float) -> float:
+        started = time.monotonic()
+        give_up_at = started + max(timeout, 0.0)
+
+        with self._condition:
+            while True:
+                wait = self._try_take(time.monotonic(), started, give_up_at, timeout)
+                if not wait:
+                    return time.monotonic() - started
+                self._condition.wait(wait)
+
+    async def acquire_async(self, timeout: float) -> float:
+        # Same queueing as acquire(), but sleeps on the event loop instead of blocking a thread.
+        started = time.monotonic()
+        give_up_at = started + max(timeout, 0.0)
+
+        while True:
+            with self._condition:
+                wait = self._try_take(time.monotonic(), started, give_up_at, timeout)
+            if not wait:
+                return time.monotonic() - started
+            await asyncio.sleep(wait)
+
+    def on_response(self, status_code: int, headers: Any = None, retry_after: Optional[float] = None) -> None:
+        with self._condition:
+            now = time.monotonic()
+            self._refill(now)
+
+            if status_code == 429:
+                # Multiplicative decrease: halve the rate and drain the bucket.
+                self._rate_limited += 1
+                self.rate = max(self.min_rate, self.rate * RATE_DECREASE_FACTOR)
+                self._tokens = 0.0
+                if retry_after:
+                    self._blocked_until = max(self._blocked_until, now + retry_after)
+                logger.warning(f"ZoomInfo rate limit hit, client rate lowered to {self.rate:.2f} requests/second")
+            elif self.rate < self.max_rate:
+                # Additive increase back towards the configured rate.
+                self.rate = min(self.max_rate, self.rate + RATE_INCREASE_STEP)
+
+            remaining = _header_number(headers, RATE_LIMIT_REMAINING_HEADER)
+            if remaining is not None:
+                self._tokens = min(self._tokens, remaining)
+                reset = _header_number(headers, RATE_LIMIT_RESET_HEADER)
+                if remaining < 1 and reset is not None:
+                    # The header is either seconds until reset or an epoch timestamp.
+                    reset_in = reset - time.time() if reset > 1e9 else reset
+                    if reset_in > 0:
+                        self._blocked_until = max(self._blocked_until, now + reset_in)
+
+            self._condition.notify_all()
+
+    def stats(self) -> dict:
+        with self._condition:
+            self._refill(time.monotonic())
+            return {
+                "rate": round(self.rate, 3),
+                "max_rate": self.max_rate,
+                "tokens": round(self._tokens, 3),
+                "acquired": self._acquired,
+                "throttled": self._throttled,
+                "rate_limited": self._rate_limited,
+                "waited_seconds": round(self._waited, 3),
+            }
+
+
+_limiters: dict[str, AdaptiveRateLimiter] = {}
+_limiters_lock = threading.Lock()
+
+
+def get_rate_limiter(username: str) -> AdaptiveRateLimiter:
+    # ZoomInfo enforces limits per account, so every tool and the session manager share one bucket per username.
+    with _limiters_lock:
+        limiter = _limiters.get(username)
+        if limiter is None:
+            limiter = AdaptiveRateLimiter()
+            _limiters[username] = limiter
+        return limiter
+
+
+def rate_limiter_stats() -> list[dict]:
+    with _limiters_lock:
+        limiters = list(_limiters.items())
+    return [{"user": f"{username[:3]}***", **limiter.stats()} for username, limiter in limiters]
@@ -0,0 +1,52 @@
+import json
+import hashlib
+from typing import Any, Optional
+from utils.single_flight import SingleFlight
+from utils.retry_policy import send_with_retry, RetryPolicy, Deadline, DEFAULT_REQUEST_BUDGET
+from utils.metrics import timed_phase
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+
+class SharedResponse:
+    def __init__(self, response):
+        self.status_code = response.status_code
+        self.headers = response.headers
+        self.text = response.text
+        self._data: Any = None
+        self._json_error: Optional[ValueError] = None
+        try:
+            with timed_phase("parse"):
+                self._data = response.json()
+        except ValueError as e:
+            self._json_error = e
+
+    def json(self) -> Any:
+        if self._json_error is not None:
+            raise self._json_error
+        return self._data
+
+
+_enrichment_flight = SingleFlight("ZoomInfo enrichment request")
+
+
+def coalesced_post(session_manager, url: str, payload: dict, policy: Optional[RetryPolicy] = None,
+                   deadline: Optional[Deadline] = None) -> SharedResponse:
+    key = hashlib.sha1(json.dumps([session_manager.cache_key, url, payload], sort_keys=True,
+                                  separators=(",", ":")).encode("utf-8")).hexdigest()
+    wait_timeout = deadline.remaining() if deadline else DEFAULT_REQUEST_BUDGET
+
+    def send() -> SharedResponse:
+        return SharedResponse(send_with_retry(session_manager, url, payload, policy=policy, deadline=deadline))
+
+    return _enrichment_flight.do(key, send, timeout=wait_timeout)
+
+
+def coalescer_stats() -> dict:
+    stats = _enrichment_flight.stats()
+    return {
+        "requests_sent": stats["executed"],
+        "requests_saved": stats["shared"],
+        "in_flight": stats["in_flight"],
+    }
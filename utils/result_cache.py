@@ -0,0 +1,122 @@
+import os
+import json
+import time
+import zlib
+import hashlib
+from typing import Any, Optional
+from utils.lru_cache import LruTtlCache
+from utils.storage_budget import storage_budget
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+RESULT_CACHE_TTLS = {
+    "enrich_company": float(os.getenv("ZOOMINFO_COMPANY_CACHE_TTL", str(24 * 3600))),
+    "enrich_contact": float(os.getenv("ZOOMINFO_CONTACT_CACHE_TTL", str(12 * 3600))),
+}
+MEMORY_CACHE_ENTRIES = int(os.getenv("ZOOMINFO_RESULT_CACHE_ENTRIES", "512"))
+
+# The persistent tier's share of the storage quota, split over a few slot keys.
+PERSISTENT_CACHE_BUDGET = storage_budget("result_cache")
+PERSISTENT_CACHE_SLOTS = 2
+
+_memory_tier = LruTtlCache(MEMORY_CACHE_ENTRIES)
+
+
+def normalize_text(value: Any) -> str:
+    return " ".join(str(value).split()).casefold()
+
+
+def make_cache_key(endpoint: str, match_input: dict, output_fields: list[str], username: str) -> str:
+    # The username keeps tenants sharing a worker process from reading each other's results.
+    material = json.dumps([
+        endpoint,
+        username,
+        sorted((key, normalize_text(value)) for key, value in match_input.items()),
+        sorted(output_fields),
+    ], separators=(",", ":"))
+    return hashlib.sha1(material.encode("utf-8")).hexdigest()[:20]
+
+
+class _PersistentTier:
+    def __init__(self, storage, budget: int = PERSISTENT_CACHE_BUDGET, slots: int = PERSISTENT_CACHE_SLOTS):
+        self.storage = storage
+        self.slots = slots
+        self.slot_budget = budget // slots
+
+    def _slot_key(self, key: str) -> str:
+        return f"zoominfo_rc_{int(key, 16) % self.slots}"
+
+    def _read_slot(self, slot_key: str) -> dict:
+        try:
+            raw = self.storage.get(slot_key)
+            if not raw:
+                return {}
+            return json.loads(zlib.decompress(raw))
+        except Exception as e:
+            logger.debug(f"Unable to read result cache slot {slot_key}: {e}")
+            return {}
+
+    def get(self, key: str) -> Optional[tuple[Any, float]]:
+        entry = self._read_slot(self._slot_key(key)).get(key)
+        if not entry:
+            return None
+        expires_at, value = entry
+        if expires_at <= time.time():
+            return None
+        return value, expires_at - time.time()
+
+    def set(self, key: str, value: Any, ttl: float) -> bool:
+        slot_key = self._slot_key(key)
+        now = time.time()
+        entries = {k: v for k, v in self._read_slot(slot_key).items() if v[0] > now and k != key}
+        entries[key] = [now + ttl, value]
+
+        # Oldest entries go first until the compressed slot fits its share of the quota.
+        while entries:
+            encoded = zlib.compress(json.dumps(entries, separators=(",", ":")).encode("utf-8"))
+            if len(encoded) <= self.slot_budget:
+                break
+            del entries[next(iter(entries))]
+
+        if key not in entries:
+            logger.debug(f"Result of {len(json.dumps(value))} bytes is too large for the persistent cache")
+            return False
+
+        try:
+            self.storage.set(slot_key, encoded)
+            return True
+        except Exception as e:
+            logger.warning(f"Failed to write result cache slot {slot_key}: {e}")
+            return False
+
+
+class EnrichmentResultCache:
+    def __init__(self, storage, tool_name: str):
+        self.tool_name = tool_name
+        self.ttl = RESULT_CACHE_TTLS.get(tool_name, 3600)
+        self._persistent = _PersistentTier(storage)
+
+    def get(self, key: str) -> tuple[Optional[Any], Optional[str]]:
+        value = _memory_tier.get(key)
+        if value is not None:
+            logger.info(f"Result cache hit (memory) for {self.tool_name}")
+            return value, "memory"
+
+        entry = self._persistent.get(key)
+        if entry is not None:
+            value, remaining_ttl = entry
+            _memory_tier.set(key, value, remaining_ttl)
+            logger.info(f"Result cache hit (storage) for {self.tool_name}")
+            return value, "storage"
+
+        logger.info(f"Result cache miss for {self.tool_name}")
+        return None, None
+
+    def set(self, key: str, value: Any) -> None:
+        _memory_tier.set(key, value, self.ttl)
+        self._persistent.set(key, value, self.ttl)
+
+
+def result_cache_stats() -> dict:
+    return _memory_tier.stats()
@@ -0,0 +1,213 @@
+import os
+import time
+import random
+import requests
+from typing import Optional
+from urllib.parse import urlparse
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from utils.http_client import get_http_client
+from utils.rate_limiter import get_rate_limiter
+from utils.circuit_breaker import get_circuit_breaker
+from utils.metrics import registry, record_phase, timed_phase, current_tool, SIZE_BUCKETS_BYTES
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Stays under MAX_REQUEST_TIMEOUT=120 in main.py so an invocation fails cleanly before Dify kills it.
+DEFAULT_REQUEST_BUDGET = float(os.getenv("ZOOMINFO_REQUEST_BUDGET", "110"))
+
+
+class Deadline:
+    def __init__(self, budget: float = DEFAULT_REQUEST_BUDGET):
+        self.budget = budget
+        self.expires_at = time.monotonic() + budget
+
+    def remaining(self) -> float:
+        return max(self.expires_at - time.monotonic(), 0.0)
+
+    def expired(self) -> bool:
+        return self.remaining() <= 0
+
+    def timeout(self, cap: float) -> float:
+        return min(cap, self.remaining())
+
+
+def _parse_retry_after(value: Optional[str]) -> Optional[float]:
+    if not value:
+        return None
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+        if retry_at.tzinfo is None:
+            retry_at = retry_at.replace(tzinfo=timezone.utc)
+        return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+    except (TypeError, ValueError):
+        return None
+
+
+class RetryPolicy:
+    def __init__(self, max_attempts: int = 4, attempt_timeout: float = 30, base_delay: float = 0.5,
+                 max_delay: float = 8.0, min_attempt_timeout: float = 1.0,
+                 reauth_statuses: frozenset = frozenset({401}),
+                 backoff_statuses: frozenset = frozenset({429, 502, 503, 504})):
+        self.max_attempts = max_attempts
+        self.attempt_timeout = attempt_timeout
+        self.base_delay = base_delay
+        self.max_delay = max_delay
+        self.min_attempt_timeout = min_attempt_timeout
+        self.reauth_statuses = reauth_statuses
+        self.backoff_statuses = backoff_statuses
+
+    def backoff_delay(self, attempt: int, response: Optional[requests.Response] = None) -> float:
+        if response is not None:
+            retry_after = _parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return retry_after
+        # Full jitter keeps concurrent invocations from retrying in lockstep.
+        return random.uniform(0, min(self.max_delay, self.base_delay * 2 ** (attempt - 1)))
+
+
+DEFAULT_RETRY_POLICY = RetryPolicy()
+
+# What follows an attempt; next_step decides, each transport carries it out with its own sleep and token calls.
+RETURN = "return"
+RETRY = "retry"
+REAUTHENTICATE = "reauthenticate"
+RAISE = "raise"
+
+
+def next_step(policy: RetryPolicy, attempt: int, deadline: Deadline, reauthenticated: bool,
+              response=None) -> tuple[str, float]:
+    # A missing response means the connection failed before reaching ZoomInfo, which is safe to retry; read timeouts
+    # and other transport errors are raised by the callers directly.
+    if response is None:
+        delay = policy.backoff_delay(attempt)
+        if attempt >= policy.max_attempts or deadline.remaining() - delay < policy.min_attempt_timeout:
+            return RAISE, 0.0
+        return RETRY, delay
+
+    status = response.status_code
+    if status in policy.reauth_statuses and not reauthenticated:
+        return REAUTHENTICATE, 0.0
+    if status in policy.backoff_statuses and attempt < policy.max_attempts:
+        delay = policy.backoff_delay(attempt, response)
+        if deadline.remaining() - delay < policy.min_attempt_timeout:
+            # Retrying would outlive the budget; hand back the error response instead.
+            return RETURN, delay
+        return RETRY, delay
+    return RETURN, 0.0
+
+
+def check_budget(policy: RetryPolicy, deadline: Deadline, url: str) -> None:
+    if deadline.remaining() < policy.min_attempt_timeout:
+        logger.error(f"Request budget of {deadline.budget:.0f}s exhausted for {url}")
+        raise Exception(f"ZoomInfo API error: request budget of {deadline.budget:.0f} seconds exhausted")
+
+
+def record_response(response, attempt: int, endpoint: str, tool: str, circuit_breaker, rate_limiter) -> None:
+    status = response.status_code
+    logger.info(f"ZoomInfo API response status: {status} (attempt {attempt})")
+    registry.inc("zoominfo_requests_total", endpoint=endpoint, status=status, tool=tool)
+    registry.observe("zoominfo_response_bytes", len(response.content), buckets=SIZE_BUCKETS_BYTES,
+                     endpoint=endpoint, tool=tool)
+    if status >= 500:
+        circuit_breaker.record_failure()
+    else:
+        circuit_breaker.record_success()
+    rate_limiter.on_response(status, response.headers,
+                             _parse_retry_after(response.headers.get("Retry-After")) if status == 429 else None)
+
+
+def log_step(action: str, delay: float, attempt: int, url: str, endpoint: str, tool: str, response=None,
+             error: Optional[Exception] = None) -> None:
+    if response is None:
+        if action == RETRY:
+            logger.warning(f"Connection error on attempt {attempt} for {url}, retrying in {delay:.2f}s: {error}")
+            registry.inc("zoominfo_retries_total", endpoint=endpoint, reason="connection_error", tool=tool)
+        return
+
+    status = response.status_code
+    if action == REAUTHENTICATE:
+        logger.warning(f"Received {status} response, re-authenticating and retrying")
+    elif action == RETRY:
+        logger.warning(f"Received {status} response, retrying in {delay:.2f}s")
+    elif delay:
+        logger.warning(f"Received {status} response, backoff of {delay:.2f}s exceeds remaining budget")
+        return
+    else:
+        return
+    registry.inc("zoominfo_retries_total", endpoint=endpoint, reason=str(status), tool=tool)
+
+
+def send_with_retry(session_manager, url: str, payload: Optional[dict], policy: Optional[RetryPolicy] = None,
+                    deadline: Optional[Deadline] = None, method: str = "POST") -> requests.Response:
+    policy = policy or DEFAULT_RETRY_POLICY
+    deadline = deadline or Deadline()
+    rate_limiter = get_rate_limiter(session_manager.username)
+    circuit_breaker = get_circuit_breaker(url)
+    endpoint = urlparse(url).path or url
+    tool = current_tool()
+    reauthenticated = False
+    attempt = 0
+
+    while True:
+        attempt += 1
+        check_budget(policy, deadline, url)
+
+        with timed_phase("token"):
+            token = session_manager.get_valid_token(timeout=deadline.timeout(policy.attempt_timeout))
+        headers = {
+            "Authorization": f"Bearer {token}",
+            "Content-Type": "application/json"
+        }
+
+        # An open breaker fails fast before the call takes a rate-limit slot.
+        circuit_breaker.before_call()
+        # Queue for a rate-limit slot rather than fail, as long as the budget allows.
+        try:
+            waited = rate_limiter.acquire(deadline.remaining() - policy.min_attempt_timeout)
+        except BaseException:
+            circuit_breaker.release()
+            raise
+        if waited:
+            record_phase("rate_limit_wait", waited * 1000, endpoint=endpoint)
+
+        try:
+            with timed_phase("http", endpoint=endpoint):
+                response = get_http_client().request(
+                    method,
+                    url,
+                    headers=headers,
+                    json=payload,
+                    timeout=deadline.timeout(policy.attempt_timeout)
+                )
+        except requests.exceptions.ConnectionError as e:
+            circuit_breaker.record_failure()
+            registry.inc("zoominfo_requests_total", endpoint=endpoint, status="connection_error", tool=tool)
+            action, delay = next_step(policy, attempt, deadline, reauthenticated)
+            log_step(action, delay, attempt, url, endpoint, tool, error=e)
+            if action == RAISE:
+                raise
+            time.sleep(delay)
+            continue
+        except requests.exceptions.RequestException as e:
+            circuit_breaker.record_failure()
+            registry.inc("zoominfo_requests_total", endpoint=endpoint, status=type(e).__name__, tool=tool)
+            raise
+
+        record_response(response, attempt, endpoint, tool, circuit_breaker, rate_limiter)
+        action, delay = next_step(policy, attempt, deadline, reauthenticated, response)
+        log_step(action, delay, attempt, url, endpoint, tool, response)
+        if action == REAUTHENTICATE:
+            with timed_phase("token_refresh"):
+                session_manager.refresh_token(token, timeout=deadline.timeout(policy.attempt_timeout))
+            reauthenticated = True
+            continue
+        if action == RETRY:
+            time.sleep(delay)
+            continue
+        return response
@@ -1,25 +1,174 @@
+import os
+import json
+import base64
+import hashlib
 import requests
-import logging
+import threading
 from typing import Optional
 from datetime import datetime, timedelta
-from dify_plugin.config.logger_format import plugin_logger_handler
+from utils.http_client import get_http_client, api_url
+from utils.single_flight import SingleFlight
+from utils.rate_limiter import get_rate_limiter
+from utils.circuit_breaker import get_circuit_breaker
+from utils.metrics import registry, record_phase, timed_phase, current_tool
+from utils.logging_setup import get_logger
 
-logger = logging.getLogger(__name__)
-logger.setLevel(logging.INFO)
-logger.addHandler(plugin_logger_handler)
+logger = get_logger(__name__)
+
+DEFAULT_TOKEN_LIFETIME = timedelta(minutes=55)
+TOKEN_EXPIRY_MARGIN = timedelta(minutes=1)
+
+
+def _credential_hash(username: str, password: str) -> str:
+    return hashlib.sha256(f"{username}\x00{password}".encode('utf-8')).hexdigest()
+
+
+def _jwt_expiry(token: str) -> Optional[datetime]:
+    try:
+        payload = token.split(".")[1]
+        payload += "=" * (-len(payload) % 4)
+        claims = json.loads(base64.urlsafe_b64decode(payload))
+        exp = claims.get("exp")
+        return datetime.fromtimestamp(int(exp)) if exp else None
+    except (IndexError, ValueError, TypeError, AttributeError):
+        return None
+
+
+class _CachedToken:
+    def __init__(self, token: str, expiry_time: datetime, obtained_at: Optional[datetime] = None):
+        self.token = token
+        self.expiry_time = expiry_time
+        self.obtained_at = obtained_at or datetime.now()
+        self.last_used = datetime.now()
+
+    def renew_at(self, fraction: float) -> datetime:
+        return self.obtained_at + (self.expiry_time - self.obtained_at) * fraction
+
+
+class _TokenCache:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._entries: dict[str, _CachedToken] = {}
+
+    def get(self, key: str) -> Optional[str]:
+        with self._lock:
+            entry = self._entries.get(key)
+        if entry is None:
+            return None
+        if datetime.now() + TOKEN_EXPIRY_MARGIN < entry.expiry_time:
+            entry.last_used = datetime.now()
+            return entry.token
+        return None
+
+    def peek(self, key: str) -> Optional[_CachedToken]:
+        with self._lock:
+            return self._entries.get(key)
+
+    def set(self, key: str, token: str, expiry_time: datetime, obtained_at: Optional[datetime] = None) -> None:
+        entry = _CachedToken(token, expiry_time, obtained_at)
+        with self._lock:
+            previous = self._entries.get(key)
+            if previous is not None:
+                entry.last_used = previous.last_used
+            self._entries[key] = entry
+
+    def invalidate(self, key: str) -> None:
+        with self._lock:
+            self._entries.pop(key, None)
+
+
+# Shared by every session manager in the worker process, so a warm worker never
+# has to go back to plugin storage for a token it has already seen.
+_token_cache = _TokenCache()
+
+# Only one authenticate/refresh runs per credential at a time; concurrent callers wait for its token.
+_auth_flight = SingleFlight("ZoomInfo authentication")
+AUTH_WAIT_TIMEOUT = 35
+AUTH_REQUEST_TIMEOUT = 30
+
+BACKGROUND_RENEWAL_ENABLED = os.getenv("ZOOMINFO_TOKEN_BACKGROUND_RENEWAL", "false").lower() in ("1", "true", "yes")
+DEFAULT_RENEWAL_FRACTION = float(os.getenv("ZOOMINFO_TOKEN_RENEWAL_FRACTION", "0.75"))
+RENEWAL_CHECK_INTERVAL = 15
+RENEWAL_IDLE_WINDOW = timedelta(minutes=10)
+
+
+class _TokenRenewer:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._tracked: dict[str, tuple["ZoomInfoSessionManager", float]] = {}
+        self._thread: Optional[threading.Thread] = None
+        self._stop = threading.Event()
+
+    def track(self, session_manager: "ZoomInfoSessionManager", fraction: float) -> None:
+        with self._lock:
+            self._tracked[session_manager.cache_key] = (session_manager, fraction)
+            if self._thread is None or not self._thread.is_alive():
+                self._stop = threading.Event()
+                self._thread = threading.Thread(target=self._run, args=(self._stop,), name="zoominfo-token-renewer",
+                                                daemon=True)
+                self._thread.start()
+                logger.info("Started background JWT token renewal thread")
+
+    def stop(self) -> None:
+        with self._lock:
+            self._tracked.clear()
+            self._stop.set()
+            self._thread = None
+
+    def _run(self, stop: threading.Event) -> None:
+        while not stop.wait(RENEWAL_CHECK_INTERVAL):
+            with self._lock:
+                # Nothing left to renew: exit, and let the next track() start a fresh thread.
+                if not self._tracked:
+                    self._thread = None
+                    logger.info("No credentials in use, stopping background JWT token renewal thread")
+                    return
+                tracked = list(self._tracked.items())
+
+            now = datetime.now()
+            for cache_key, (session_manager, fraction) in tracked:
+                entry = _token_cache.peek(cache_key)
+                if entry is None:
+                    with self._lock:
+                        self._tracked.pop(cache_key, None)
+                    continue
+
+                # Only keep renewing while the credential is receiving traffic.
+                if now - entry.last_used > RENEWAL_IDLE_WINDOW:
+                    logger.info("Credential idle, stopping background JWT token renewal")
+                    with self._lock:
+                        self._tracked.pop(cache_key, None)
+                    continue
+
+                if now >= entry.renew_at(fraction):
+                    try:
+                        session_manager.renew_token()
+                    except Exception as e:
+                        logger.warning(f"Background JWT token renewal failed: {e}")
+
+
+_token_renewer = _TokenRenewer()
+
+
+def _wait_timeout(timeout: Optional[float]) -> float:
+    return AUTH_WAIT_TIMEOUT if timeout is None else min(timeout, AUTH_WAIT_TIMEOUT)
 
 
 class ZoomInfoSessionManager:
-    def __init__(self, username: str, password: str, storage):
+    def __init__(self, username: str, password: str, storage, background_renewal: Optional[bool] = None,
+                 renewal_fraction: Optional[float] = None):
         self.username = username
         self.password = password
         self.storage = storage
+        self.background_renewal = BACKGROUND_RENEWAL_ENABLED if background_renewal is None else background_renewal
+        self.renewal_fraction = DEFAULT_RENEWAL_FRACTION if renewal_fraction is None else renewal_fraction
         self.token_key = f"zoominfo_jwt_{username}"
         self.token_expiry_key = f"zoominfo_jwt_expiry_{username}"
+        self.cache_key = _credential_hash(username, password)
 
         logger.info(f"Initialized ZoomInfo session manager for user: {username[:3]}***")
 
-    def _authenticate(self) -> Optional[str]:
+    def _authenticate(self, timeout: float = AUTH_REQUEST_TIMEOUT) -> Optional[str]:
         logger.info(f"Starting authentication for user: {self.username[:3]}***")
 
         try:
@@ -32,21 +181,43 @@ class ZoomInfoSessionManager:
                 "Content-Type": "application/json"
             }
 
+            # An open breaker rejects the call before it takes a rate-limit slot.
+            circuit_breaker = get_circuit_breaker(api_url("authenticate"))
+            circuit_breaker.before_call()
+            rate_limiter = get_rate_limiter(self.username)
+            try:
+                waited = rate_limiter.acquire(timeout)
+            except BaseException:
+                circuit_breaker.release()
+                raise
+            if waited:
+                record_phase("rate_limit_wait", waited * 1000)
+
             logger.info("Sending authentication request to ZoomInfo API")
-            response = requests.post(
-                "https://api.zoominfo.com/authenticate",
-                headers=headers,
-                json=auth_payload,
-                timeout=30
-            )
+            try:
+                with timed_phase("authenticate", endpoint="/authenticate"):
+                    response = get_http_client().post(
+                        api_url("authenticate"),
+                        headers=headers,
+                        json=auth_payload,
+                        timeout=max(timeout - waited, 1.0)
+                    )
+            except requests.exceptions.RequestException:
+                circuit_breaker.record_failure()
+                raise
 
             logger.info(f"Authentication response status: {response.status_code}")
+            rate_limiter.on_response(response.status_code, response.headers)
+            if response.status_code >= 500:
+                circuit_breaker.record_failure()
+            else:
+                circuit_breaker.record_success()
 
             if response.status_code == 200:
                 result = response.json()
                 token = result.get("jwt")
                 if token:
-                    expiry_time = datetime.now() + timedelta(minutes=55)
+                    expiry_time = _jwt_expiry(token) or datetime.now() + DEFAULT_TOKEN_LIFETIME
                     logger.info(f"Authentication successful, token expires at: {expiry_time.isoformat()}")
                     self._store_token(token, expiry_time)
                     return token
@@ -63,7 +234,8 @@ class ZoomInfoSessionManager:
         except requests.exceptions.Timeout as e:
             logger.error(f"ZoomInfo authentication request timed out: {e}")
             raise Exception(
-                f"ZoomInfo authentication request timed out after 30 seconds. Check your network connection: {e}")
+                f"ZoomInfo authentication request timed out after {timeout:.0f} seconds. "
+                f"Check your network connection: {e}")
         except requests.exceptions.ConnectionError as e:
             logger.error(f"Failed to connect to ZoomInfo API: {e}")
             raise Exception(f"Failed to connect to ZoomInfo API. Check your network connection: {e}")
@@ -71,7 +243,7 @@ class ZoomInfoSessionManager:
             logger.error(f"Network error during ZoomInfo authentication: {e}")
             raise Exception(f"Network error during ZoomInfo authentication: {e}")
         except Exception as e:
-            if "Invalid ZoomInfo" in str(e) or "Authentication failed" in str(e):
+            if "Invalid ZoomInfo" in str(e) or "Authentication failed" in str(e) or "ZoomInfo API error" in str(e):
                 raise e
             else:
                 logger.error(f"Unexpected error during ZoomInfo authentication: {e}")
@@ -80,6 +252,8 @@ class ZoomInfoSessionManager:
         return None
 
     def _store_token(self, token: str, expiry_time: datetime) -> None:
+        _token_cache.set(self.cache_key, token, expiry_time)
+
         try:
             logger.info("Storing JWT token in persistent storage")
 
@@ -105,14 +279,15 @@ class ZoomInfoSessionManager:
         logger.info("Checking for stored JWT token")
 
         try:
-            token_bytes = self.storage.get(self.token_key)
+            with timed_phase("token_storage_read"):
+                token_bytes = self.storage.get(self.token_key)
+                expiry_bytes = self.storage.get(self.token_expiry_key) if token_bytes else None
             if not token_bytes:
                 logger.info("No stored JWT token found")
                 return None
 
             token = token_bytes.decode('utf-8')
 
-            expiry_bytes = self.storage.get(self.token_expiry_key)
             if not expiry_bytes:
                 logger.warning("Stored token found but no expiry information, considering invalid")
                 return None
@@ -121,8 +296,12 @@ class ZoomInfoSessionManager:
             expiry_time = datetime.fromisoformat(expiry_str)
 
             current_time = datetime.now()
-            if current_time + timedelta(minutes=1) < expiry_time:
+            if current_time + TOKEN_EXPIRY_MARGIN < expiry_time:
                 logger.info(f"Valid stored token found, expires at: {expiry_time.isoformat()}")
+                # A stored token was issued before this worker saw it; date it from its expiry so the
+                # refresh-ahead point is not pushed back to a full lifetime from now.
+                obtained_at = min(current_time, expiry_time - DEFAULT_TOKEN_LIFETIME)
+                _token_cache.set(self.cache_key, token, expiry_time, obtained_at)
                 return token
             else:
                 logger.info(f"Stored token expired at: {expiry_time.isoformat()}, cleaning up")
@@ -134,6 +313,8 @@ class ZoomInfoSessionManager:
             return None
 
     def _clear_stored_token(self) -> None:
+        _token_cache.invalidate(self.cache_key)
+
         try:
             logger.info("Clearing stored JWT token from persistent storage")
             self.storage.delete(self.token_key)
@@ -143,16 +324,42 @@ class ZoomInfoSessionManager:
             logger.warning(f"Error clearing stored token: {e}")
             pass
 
-    def get_valid_token(self) -> str:
-        logger.info("Getting valid JWT token")
+    def cached_token(self) -> Optional[str]:
+        # Only consults the in-process cache, so it never blocks on storage or the network.
+        if self.background_renewal:
+            _token_renewer.track(self, self.renewal_fraction)
+
+        token = _token_cache.get(self.cache_key)
+        if token:
+            logger.debug("Using in-process cached JWT token")
+            registry.inc("zoominfo_token_lookups_total", source="memory", tool=current_tool())
+        return token
+
+    def get_valid_token(self, timeout: Optional[float] = None) -> str:
+        token = self.cached_token()
+        if token:
+            return token
+
+        return _auth_flight.do(self.cache_key, lambda: self._acquire_token(timeout), timeout=_wait_timeout(timeout))
+
+    def _acquire_token(self, timeout: Optional[float] = None) -> str:
+        # Another caller may have finished authenticating while this one was queued behind the lock.
+        token = _token_cache.get(self.cache_key)
+        if token:
+            return token
+
+        logger.info("No in-process cached token, checking persistent storage")
 
         token = self._get_stored_token()
         if token:
             logger.info("Using cached JWT token")
+            registry.inc("zoominfo_token_lookups_total", source="storage", tool=current_tool())
             return token
 
+        registry.inc("zoominfo_token_lookups_total", source="authenticate", tool=current_tool())
+
         logger.info("No valid cached token, authenticating for new token")
-        token = self._authenticate()
+        token = self._authenticate(timeout or AUTH_REQUEST_TIMEOUT)
         if not token:
             logger.error("Failed to obtain JWT token from ZoomInfo")
             raise Exception("Failed to obtain JWT token from ZoomInfo")
@@ -160,11 +367,38 @@ class ZoomInfoSessionManager:
         logger.info("Successfully obtained new JWT token")
         return token
 
-    def refresh_token(self) -> str:
+    def refresh_token(self, stale_token: Optional[str] = None, timeout: Optional[float] = None) -> str:
+        return _auth_flight.do(self.cache_key, lambda: self._rotate_token(stale_token, timeout),
+                               timeout=_wait_timeout(timeout))
+
+    def _rotate_token(self, stale_token: Optional[str], timeout: Optional[float] = None) -> str:
+        current_token = _token_cache.get(self.cache_key)
+        if current_token and stale_token and current_token != stale_token:
+            logger.info("JWT token was already rotated by a concurrent invocation")
+            return current_token
+
         logger.info("Force refreshing JWT token")
+        registry.inc("zoominfo_token_refreshes_total", tool=current_tool())
 
         self._clear_stored_token()
 
-        new_token = self.get_valid_token()
+        new_token = self._acquire_token(timeout)
         logger.info("JWT token successfully refreshed")
         return new_token
+
+    def renew_token(self) -> str:
+        return _auth_flight.do(self.cache_key, self._renew_token, timeout=AUTH_WAIT_TIMEOUT)
+
+    def _renew_token(self) -> str:
+        entry = _token_cache.peek(self.cache_key)
+        if entry is not None and datetime.now() < entry.renew_at(self.renewal_fraction):
+            return entry.token
+
+        # The current token stays in the cache and keeps serving requests until the new one replaces it.
+        logger.info("Renewing JWT token ahead of expiry")
+        token = self._authenticate()
+        if not token:
+            raise Exception("Failed to renew JWT token from ZoomInfo")
+
+        logger.info("JWT token renewed in background")
+        return token
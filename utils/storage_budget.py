@@ -0,0 +1,27 @@
+import os
+
+# manifest.yaml (resource.permission.storage.size) grants every installation 4096 bytes of plugin storage, and a
+# storage.set that would exceed it fails. All persistent data is carved out of that one quota here.
+STORAGE_QUOTA = int(os.getenv("ZOOMINFO_STORAGE_QUOTA", "4096"))
+
+# ZoomInfoSessionManager._store_token writes the JWT (about 1.2 KB) plus its ISO expiry timestamp. It is reserved
+# first: losing it means every invocation authenticates again.
+TOKEN_STORAGE_RESERVE = int(os.getenv("ZOOMINFO_TOKEN_STORAGE_RESERVE", "1536"))
+
+# Shares of whatever the token leaves over; they add up to 1 so the consumers together never exceed the quota.
+STORAGE_SHARES = {
+    "result_cache": 0.4,
+    "watermarks": 0.4,
+    "field_catalog": 0.2,
+}
+
+
+def storage_budget(consumer: str, parts: int = 1) -> int:
+    available = max(STORAGE_QUOTA - TOKEN_STORAGE_RESERVE, 0)
+    return int(available * STORAGE_SHARES[consumer]) // max(parts, 1)
+
+
+def storage_plan() -> dict:
+    plan = {"quota": STORAGE_QUOTA, "token": TOKEN_STORAGE_RESERVE}
+    plan.update({consumer: storage_budget(consumer) for consumer in STORAGE_SHARES})
+    return plan
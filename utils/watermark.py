@@ -0,0 +1,211 @@
+import json
+import zlib
+import base64
+import hashlib
+import threading
+from typing import Any, Optional
+from utils.date_shards import item_date
+from utils.storage_budget import storage_budget
+from utils.logging_setup import get_logger
+
+logger = get_logger(__name__)
+
+# Each kind is stored under its own key, so the watermark share of the storage quota is split between them.
+WATERMARK_KINDS = ("news", "scoop")
+WATERMARK_BUDGET = storage_budget("watermarks", parts=len(WATERMARK_KINDS))
+MAX_UNDATED_IDS = 10
+
+# 3-byte digests are exactly 4 base64 characters, so a company's ids are stored as one string with no separators.
+KEY_DIGEST_BYTES = 3
+KEY_LENGTH = 4
+
+_store_locks: dict[str, threading.Lock] = {}
+_store_locks_guard = threading.Lock()
+
+
+def article_key(item: Any) -> str:
+    if isinstance(item, dict):
+        identity = item.get("id") or item.get("url") or item.get("title") or json.dumps(item, sort_keys=True)
+    else:
+        identity = item
+    digest = hashlib.blake2b(str(identity).encode("utf-8"), digest_size=KEY_DIGEST_BYTES).digest()
+    return base64.b64encode(digest).decode("ascii")
+
+
+def _join_keys(keys: list[str]) -> str:
+    return "".join(keys)
+
+
+def _split_keys(joined: str) -> list[str]:
+    return [joined[index:index + KEY_LENGTH] for index in range(0, len(joined), KEY_LENGTH)]
+
+
+def _lock_for(storage_key: str) -> threading.Lock:
+    with _store_locks_guard:
+        return _store_locks.setdefault(storage_key, threading.Lock())
+
+
+class ResumeCursor:
+    # The older end of a walk that max_items cut off. Items between since and until are still owed, except the ones
+    # on since_date that the mark had already seen and the ones on until_date that the cut-off walk already fetched.
+    def __init__(self, since_date: str, since_ids: list[str], until_date: str, until_ids: list[str]):
+        self.since_date = since_date
+        self.since_ids = since_ids
+        self.until_date = until_date
+        self.until_ids = until_ids
+
+    def is_owed(self, published: str, key: str) -> bool:
+        if published > self.until_date or (published == self.until_date and key in self.until_ids):
+            return False
+        if published < self.since_date or (published == self.since_date and key in self.since_ids):
+            return False
+        return True
+
+    def to_dict(self) -> dict:
+        return {"since_date": self.since_date, "until_date": self.until_date}
+
+
+class Watermark:
+    def __init__(self, latest_date: str, recent_ids: list[str], undated_ids: Optional[list[str]] = None,
+                 resume: Optional[ResumeCursor] = None):
+        self.latest_date = latest_date
+        # Every item seen on latest_date; bounded by one day of results, and the only way to tell a late arrival on
+        # that day from one already sent.
+        self.recent_ids = recent_ids
+        # Undated articles cannot be placed against latest_date, so the ones already sent are remembered by hash.
+        self.undated_ids = undated_ids or []
+        self.resume = resume
+
+    def walk_range(self, date_min: str, date_max: str) -> tuple[str, str]:
+        # While a cut-off walk is owed, runs drain it before looking past latest_date again.
+        if self.resume is not None:
+            return max(date_min, self.resume.since_date), min(date_max, self.resume.until_date)
+        return max(date_min, self.latest_date), date_max
+
+    def is_new(self, item: Any) -> bool:
+        key = article_key(item)
+        published = item_date(item)[:10]
+        if not published:
+            return key not in self.undated_ids
+        if self.resume is not None:
+            return self.resume.is_owed(published, key)
+        if published != self.latest_date:
+            return published > self.latest_date
+        return key not in self.recent_ids
+
+    def advanced_by(self, fetched: list, delivered: list, complete: bool) -> "Watermark":
+        latest_date = self.latest_date
+        recent_ids = list(self.recent_ids)
+        undated_ids = list(self.undated_ids)
+        for item in delivered:
+            published = item_date(item)[:10]
+            if not published:
+                undated_ids.append(article_key(item))
+                continue
+            # A drain run only delivers items at or below latest_date, which the mark already covers.
+            if self.resume is not None:
+                continue
+            if published > latest_date:
+                latest_date = published
+                recent_ids = []
+            if published == latest_date:
+                recent_ids.append(article_key(item))
+
+        resume = None
+        fetched_dates = [item_date(item)[:10] for item in fetched if item_date(item)]
+        if not complete and fetched_dates:
+            # Results are newest first, so everything older than the oldest fetched date, and anything on that date
+            # the walk did not reach, is still owed.
+            until_date = min(fetched_dates)
+            until_ids = [article_key(item) for item in fetched if item_date(item)[:10] == until_date]
+            if self.resume is not None:
+                since_date, since_ids = self.resume.since_date, self.resume.since_ids
+                if until_date == self.resume.until_date:
+                    until_ids = self.resume.until_ids + until_ids
+            else:
+                since_date, since_ids = self.latest_date, self.recent_ids
+            resume = ResumeCursor(since_date, since_ids, until_date, list(dict.fromkeys(until_ids)))
+        elif not complete:
+            resume = self.resume
+
+        return Watermark(latest_date, list(dict.fromkeys(recent_ids)),
+                         list(dict.fromkeys(undated_ids))[-MAX_UNDATED_IDS:], resume)
+
+    def to_dict(self) -> dict:
+        return {"latest_date": self.latest_date, "recent_ids": self.recent_ids, "undated_ids": self.undated_ids,
+                "resume": self.resume.to_dict() if self.resume else None}
+
+    def to_entry(self) -> list:
+        # Compact stored form: dates as ISO strings, ids as joined 4-character keys, empty trailing parts dropped.
+        entry = [self.latest_date, _join_keys(self.recent_ids), _join_keys(self.undated_ids)]
+        if self.resume is not None:
+            entry.append([self.resume.since_date, _join_keys(self.resume.since_ids),
+                          self.resume.until_date, _join_keys(self.resume.until_ids)])
+        while len(entry) > 2 and not entry[-1]:
+            entry.pop()
+        return entry
+
+    @classmethod
+    def from_entry(cls, entry: list) -> "Watermark":
+        resume = None
+        if len(entry) > 3:
+            since_date, since_ids, until_date, until_ids = entry[3]
+            resume = ResumeCursor(since_date, _split_keys(since_ids), until_date, _split_keys(until_ids))
+        return cls(entry[0], _split_keys(entry[1]), _split_keys(entry[2]) if len(entry) > 2 else [], resume)
+
+
+class WatermarkStore:
+    def __init__(self, storage, kind: str, budget: int = WATERMARK_BUDGET):
+        self.storage = storage
+        self.storage_key = f"zoominfo_wm_{kind}"
+        self.budget = budget
+
+    def _load(self) -> dict:
+        try:
+            raw = self.storage.get(self.storage_key)
+            if not raw:
+                return {}
+            return json.loads(zlib.decompress(raw))
+        except Exception as e:
+            logger.warning(f"Unable to read watermarks from {self.storage_key}: {e}")
+            return {}
+
+    def load(self) -> dict[int, Watermark]:
+        watermarks = {}
+        for company_id, entry in self._load().items():
+            try:
+                watermarks[int(company_id)] = Watermark.from_entry(entry)
+            except (TypeError, ValueError) as e:
+                logger.warning(f"Ignoring unreadable watermark for company {company_id}: {e}")
+        return watermarks
+
+    def advance(self, updates: dict[int, Watermark]) -> list[int]:
+        # Returns the companies whose watermark had to be dropped to fit the budget; their next run starts over.
+        if not updates:
+            return []
+
+        evicted = []
+        # One read-modify-write of a single key, so all companies advance together or not at all.
+        with _lock_for(self.storage_key):
+            entries = self._load()
+            for company_id, watermark in updates.items():
+                entries.pop(str(company_id), None)
+                entries[str(company_id)] = watermark.to_entry()
+
+            while entries:
+                encoded = zlib.compress(json.dumps(entries, separators=(",", ":")).encode("utf-8"))
+                if len(encoded) <= self.budget:
+                    break
+                oldest = next(iter(entries))
+                logger.warning(f"Watermark budget exceeded, evicting least recently synced company {oldest}")
+                del entries[oldest]
+                evicted.append(int(oldest))
+            else:
+                encoded = zlib.compress(b"{}")
+
+            try:
+                self.storage.set(self.storage_key, encoded)
+                logger.info(f"Advanced watermarks for {len(updates)} companies")
+            except Exception as e:
+                logger.warning(f"Failed to store watermarks in {self.storage_key}: {e}")
+        return evicted